@@ -0,0 +1,197 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+import src.config.game_config as gc
+from src.model.path import Path, add_path
+from src.model.path_validation import validate_path
+from src.model.point import Point, GraphicsPoint
+from src.model.move_stats import MoveStats
+from src.model.point_snapshot import PointSnapshot
+from src.model.region import Region
+from src.model.snapshot import Snapshot
+
+SIZES = (2, 5, 10, 20, 50, 100, 200)  # Numbers of starting points of the benchmarked games
+GAMES = 3                               # Games played per size
+MAX_FAILED_MOVES = 50                   # Random moves tried in a row before a game is considered stuck
+POINTS_PER_BOARD = 20                   # Starting points on a board of the size of the window, larger games get larger boards
+NEAREST_POINTS = 3                      # A move connects a point to itself or one of its nearest available points
+LOOP_RADIUS = 60                        # Distance of the corners of a loop from its point at most
+CANDIDATES = 32                         # Random points tested at once when looking for a corner of a move
+PHASES = ("find_region", "update_region_tree", "detect_cycles", "create_regions", "insert_rotation", "transfer_points",
+          "update_connections")
+
+
+### MAIN RESPONSIBILITY: BJÖRN WILTING S184214 ###
+# Headless benchmark of the region tree. Plays seeded games of random moves through Region directly, without the game
+# window, and records the time spent on each phase of every move with the move statistics of the region tree, so it
+# runs without the ui package
+# Usage: python -m src.benchmark.region_benchmark --sizes 2 20 200 --output scaling.json
+
+# A game of Sprouts played with random moves
+class BenchmarkGame:
+    def __init__(self, num_points, seed):
+        self.random = random.Random(seed)
+        scale = max(1.0, math.sqrt(num_points / POINTS_PER_BOARD))
+        self.width = int(gc.WINDOW_WIDTH * scale)
+        self.height = int(gc.WINDOW_HEIGHT * scale)
+
+        GraphicsPoint.setLastID(0)
+        self.points = [GraphicsPoint(self.random.randint(50, self.width - 50), self.random.randint(50, self.height - 50))
+                       for _ in range(num_points)]
+        border_points = [GraphicsPoint(0, 0, False), GraphicsPoint(self.width, 0, False),
+                         GraphicsPoint(self.width, self.height, False), GraphicsPoint(0, self.height, False)]
+        self.base_region = Region(set(self.points), border_points, edge_map={}, exclusions=set())
+        self.paths = []
+
+    # Returns the clicks of a random move between two close points of a random open region, or None
+    # Moves between far apart points would cross other points on large boards, and rarely be valid
+    def random_move(self):
+        # Sets are ordered by object ids, sorting keeps the game the same for the same seed
+        regions = sorted(self.base_region.index.open_regions, key=lambda region: region.id)
+        if not regions:
+            return None
+        region = self.random.choice(regions)
+        available = sorted((point for point in region.game_points if point.available()), key=lambda point: point.index)
+        start = self.random.choice(available)
+        nearest = sorted(available, key=lambda point: start.distance_sq(point))[:NEAREST_POINTS + 1]
+        end = self.random.choice(nearest)
+        if start is end and start.num_paths + 2 > 3:
+            return None
+
+        if start is end:
+            clicks = [start, self.random_point_in(region, start, LOOP_RADIUS),
+                      self.random_point_in(region, start, LOOP_RADIUS), end]
+        else:
+            center = Point((start.x + end.x) / 2, (start.y + end.y) / 2)
+            clicks = [start, self.random_point_in(region, center, math.sqrt(start.distance_sq(end)) / 2), end]
+        if None in clicks:
+            return None
+        return clicks
+
+    # Returns a random point inside the given region and near the given center, or None if none was found
+    def random_point_in(self, region, center, radius):
+        angles = [self.random.uniform(0, 2 * math.pi) for _ in range(CANDIDATES)]
+        distances = [self.random.uniform(0, radius) for _ in range(CANDIDATES)]
+        candidates = np.column_stack([center.x + np.cos(angles) * distances, center.y + np.sin(angles) * distances])
+        inside = np.flatnonzero(region.is_points_in_region(candidates))
+        if not len(inside):
+            return None
+        return Point(*candidates[inside[0]].tolist())
+
+    # Plays one random move, timing its phases
+    # The record of the move in the move statistics gets the time spent on finding the region and on the whole
+    # update_region_tree, and the number of regions after the move
+    # Output: True if a move was played
+    def play_move(self, stats):
+        clicks = self.random_move()
+        if clicks is None:
+            return False
+        _, valid_path = validate_path(Path.from_points(clicks), self.paths, PointSnapshot(self.points))
+        if not valid_path:
+            return False
+
+        # The move is rolled back if its new point is not found in any region
+        snapshot = Snapshot.take()
+        start_path, end_path, mid_point = add_path(clicks[0], clicks[-1], clicks)
+        start = time.perf_counter()
+        region = self.base_region.find_region(mid_point)
+        find_seconds = time.perf_counter() - start
+        if region is None:
+            snapshot.restore()
+            return False
+        snapshot.release()
+
+        start = time.perf_counter()
+        region.update_region_tree([start_path, end_path], mid_point)
+        update_seconds = time.perf_counter() - start
+        self.paths.extend([start_path, end_path])
+        self.points.append(mid_point)
+
+        record = stats.moves[-1]
+        record["phases"]["find_region"] = find_seconds
+        record["phases"]["update_region_tree"] = update_seconds
+        record["regions"] = sum(1 for _ in self.base_region.subtree())
+        return True
+
+    # Plays until the game is over, or no random move can be found
+    # The moves are recorded by the given move statistics, which must be recording
+    def play(self, stats, max_moves=None):
+        failed = 0
+        moves = 0
+        while self.base_region.find_open_region() and failed < MAX_FAILED_MOVES:
+            if max_moves is not None and moves >= max_moves:
+                break
+            if self.play_move(stats):
+                moves += 1
+                failed = 0
+            else:
+                failed += 1
+        return moves
+
+
+# Flattens the record of a move into one dictionary of phase times in milliseconds, counters, tree depth and regions
+def flatten(record):
+    move = {phase: seconds * 1000 for phase, seconds in record["phases"].items()}
+    move.update(record["counters"])
+    move["tree_depth"] = record["tree_depth"]
+    move["regions"] = record["regions"]
+    return move
+
+
+# Summarizes the phase times of a list of flattened moves in milliseconds
+def summarize(moves):
+    summary = {}
+    for phase in PHASES:
+        times = np.array([move.get(phase, 0) for move in moves])
+        if not len(times):
+            times = np.zeros(1)
+        summary[phase] = {"mean_ms": float(times.mean()), "p50_ms": float(np.percentile(times, 50)),
+                          "p95_ms": float(np.percentile(times, 95)), "total_ms": float(times.sum())}
+    return summary
+
+
+# Plays the games of every size and collects the time per move of each phase
+# Input: The numbers of starting points, the games per size, the seed of the first game, an optional move limit
+# Output: Dictionary with the moves of every size, a summary per size and a scaling curve per phase
+def run(sizes=SIZES, games=GAMES, seed=0, max_moves=None):
+    results = {}
+    for size in sizes:
+        played = []
+        with MoveStats() as stats, contextlib.redirect_stdout(io.StringIO()):
+            for game in range(games):
+                played.append(BenchmarkGame(size, seed + game).play(stats, max_moves))
+        moves = [flatten(record) for record in stats.moves]
+        results[size] = {"games": games, "moves_per_game": played, "summary": summarize(moves), "moves": moves}
+
+    curves = {phase: [results[size]["summary"][phase]["mean_ms"] for size in sizes] for phase in PHASES}
+    return {"sizes": list(sizes), "seed": seed, "results": {str(size): result for size, result in results.items()},
+            "curves": curves}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark region tree maintenance over board sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="numbers of starting points")
+    parser.add_argument("--games", type=int, default=GAMES, help="games per size")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game of every size")
+    parser.add_argument("--max-moves", type=int, default=None, help="moves per game at most")
+    parser.add_argument("--output", default=None, help="JSON file to write, standard output if not given")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.games, args.seed, args.max_moves)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,11 @@
 WINDOW_HEIGHT = 500
 WINDOW_WIDTH = 800
 FPS = 60
+IDLE_TIMEOUT = 500  # Milliseconds a loop waits for events before it checks the screen again
+PROFILE_FILE = "profile.csv"  # Written when F4 is pressed during a game
+# Experimental: test points against the curves of a region instead of its approximated border
+# The approximated border is still kept for drawing and the region index, so creating regions is slower in this mode
+EXACT_REGION_BORDERS = False
 
 # UI colors
 UI_BUTTON_COLOR = (250, 250, 50)
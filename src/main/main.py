@@ -1,18 +1,27 @@
 import random
 from typing import List, Tuple
 import os, sys
+import time
 import pygame
 import pygame.gfxdraw
 import src.config.game_config as gc
 
 from src.model.path import Path, add_path
+from src.model.path_validation import validate_path
 from src.model.point import Point, GraphicsPoint
+from src.model.point_snapshot import PointSnapshot
 from src.model.region import Region
 from src.model.rrt import RRT
+from src.model.spatial_hash import SpatialHash
 from src.validation import planarity
 from src.model.values import Player, State
+from src.main.move_validator import MoveValidator, VALIDATION_DONE
 
+from src.ui import assets
 from src.ui.component import Button, Label
+from src.ui.profiler import Profiler, ProfilerOverlay
+from src.ui.renderer import Renderer
+from src.ui.sprite_cache import draw_point, point_bounds
 
 
 ### MAIN RESPONSIBILITY FOR VALIDATION FUNCTION: OLAV NØRGAARD OLSEN S184195 ###
@@ -23,12 +32,12 @@ class Main:
     def __init__(self, initial_points, initial_paths):
         pygame.init()
         pygame.display.set_caption("Sprouts")
-        img = pygame.image.load("../../res/sproutsbg.png")
-        pygame.display.set_icon(img)
+        pygame.display.set_icon(assets.load(assets.BACKGROUND_IMAGE))
 
         self.CLOCK = pygame.time.Clock()
         self.SCREEN = pygame.display.set_mode((gc.WINDOW_WIDTH, gc.WINDOW_HEIGHT))
         self.SURFACE = pygame.Surface(self.SCREEN.get_size(), pygame.SRCALPHA)
+        self.renderer = Renderer(self.SCREEN)
 
         self.PLAYER = Player.PLAYER_1
         self.NUM_POINTS = 2
@@ -51,6 +60,11 @@ class Main:
                               GraphicsPoint(0, gc.WINDOW_HEIGHT, False)]
 
         self.points = None
+        self.spatial_hash = None
+        self.static_layer = None
+        self.profiler = None
+        self.profiler_overlay = None
+        self.validator = None
         self.base_region = None
 
         self.run(State.MAIN_MENU, [False])
@@ -71,6 +85,9 @@ class Main:
 
     # Resets the variables of the game loop-
     def hard_reset(self):
+        if self.validator:
+            self.validator.shutdown()
+
         self.PLAYER = Player.PLAYER_1
 
         self.creating_path = False
@@ -89,6 +106,11 @@ class Main:
                               GraphicsPoint(gc.WINDOW_WIDTH, gc.WINDOW_HEIGHT, False),
                               GraphicsPoint(0, gc.WINDOW_HEIGHT, False)]
         self.points = None
+        self.spatial_hash = None
+        self.static_layer = None
+        self.profiler = None
+        self.profiler_overlay = None
+        self.validator = None
         self.base_region = None
 
     def main_menu(self, error=None):
@@ -113,15 +135,25 @@ class Main:
         input_field = Label(270, 200, button_width, button_height, gc.WHITE, gc.BLACK, 2, filename, 25,
                             gc.UI_BUTTON_TEXT_COLOR)
 
-        surfaces = [button_1.draw(), button_2.draw(), button_3.draw(), input_field.draw()]
+        widgets = [button_1, button_2, button_3, input_field]
         buttons = [button_1, button_2, button_3]
+        self.update_hover(buttons, pygame.mouse.get_pos())
+        # Everything behind the widgets changed as well, so the first frame presents the whole screen
+        self.present_widgets(widgets, everything=True)
+        widgets = []
 
         active = False
 
         while True:
+            # Present only the widgets that changed
+            if widgets:
+                self.present_widgets(widgets)
+                widgets = []
+
+            events = self.wait_for_events()
             mouse = pygame.mouse.get_pos()
 
-            for event in pygame.event.get():
+            for event in events:
 
                 if event.type == pygame.QUIT:
                     sys.exit()
@@ -144,7 +176,7 @@ class Main:
                         elif event.key == pygame.K_BACKSPACE:
                             filename = filename[:-1]
                             input_field.text = filename
-                            surfaces.append(input_field.draw())
+                            widgets.append(input_field)
                             button_2.parameters = [filename]
 
                         else:
@@ -153,29 +185,14 @@ class Main:
                             if key.isascii():
                                 filename += key
                                 input_field.text = filename
-                                surfaces.append(input_field.draw())
+                                widgets.append(input_field)
                                 button_2.parameters = [filename]
 
-            for button in buttons:
-                if button.hovering(mouse):
-                    button.color = gc.UI_BUTTON_COLOR_HOVER
-                    surfaces.append(button.draw())
-                else:
-                    button.color = gc.UI_BUTTON_COLOR
-                    surfaces.append(button.draw())
-
-            for surface in surfaces:
-                self.SCREEN.blit(surface, (0, 0))
-
-            surfaces = []
-
-            pygame.display.update()
+            widgets.extend(self.update_hover(buttons, mouse))
 
     def options_loop(self):
         self.draw_background()
 
-        surfaces = []
-
         # Create and draw the input fields
         input_label = Label(50, 100, 300, 30, gc.WHITE, gc.WHITE, 0, "Number of points: (between 1 and 20)", 22,
                             gc.UI_BUTTON_TEXT_COLOR)
@@ -186,14 +203,23 @@ class Main:
         button_back = Button(370, 150, 200, 30, gc.UI_BUTTON_COLOR, gc.UI_BUTTON_BORDER_COLOR, 2, "Back", 25,
                              gc.UI_BUTTON_TEXT_COLOR, State.MAIN_MENU, [])
 
-        surfaces.extend([input_field.draw(), input_label.draw(), button_back.draw()])
+        widgets = [input_field, input_label, button_back]
+        # Everything behind the widgets changed as well, so the first frame presents the whole screen
+        self.present_widgets(widgets, everything=True)
+        widgets = []
 
         active = False
 
         while True:
+            # Present only the widgets that changed
+            if widgets:
+                self.present_widgets(widgets)
+                widgets = []
+
+            events = self.wait_for_events()
             mouse = pygame.mouse.get_pos()
 
-            for event in pygame.event.get():
+            for event in events:
 
                 if event.type == pygame.QUIT:
                     sys.exit(0)
@@ -225,21 +251,16 @@ class Main:
 
                         elif event.key == pygame.K_BACKSPACE:
                             input_field.text = input_field.text[:-1]
-                            surfaces.append(input_field.draw())
+                            widgets.append(input_field)
 
                         else:
                             key = event.unicode
 
                             if key.isnumeric():
                                 input_field.text += key
-                                surfaces.append(input_field.draw())
-
-            for surface in surfaces:
-                self.SCREEN.blit(surface, (0, 0))
+                                widgets.append(input_field)
 
-            surfaces = []
 
-            pygame.display.update()
 
     # Screen displayed when game over
     def game_over_loop(self):
@@ -265,13 +286,23 @@ class Main:
                                   2,
                                   "Main menu", 25, gc.UI_BUTTON_TEXT_COLOR, State.MAIN_MENU, [])
 
-        surfaces = [button_restart.draw(), button_main_menu.draw(), winning_label.draw()]
+        widgets = [button_restart, button_main_menu, winning_label]
         buttons = [button_restart, button_main_menu]
+        self.update_hover(buttons, pygame.mouse.get_pos())
+        # Everything behind the widgets changed as well, so the first frame presents the whole screen
+        self.present_widgets(widgets, everything=True)
+        widgets = []
 
         while True:
+            # Present only the widgets that changed
+            if widgets:
+                self.present_widgets(widgets)
+                widgets = []
+
+            events = self.wait_for_events()
             mouse = pygame.mouse.get_pos()
 
-            for event in pygame.event.get():
+            for event in events:
 
                 if event.type == pygame.QUIT:
                     sys.exit()
@@ -284,20 +315,38 @@ class Main:
                             state, params = button.get_action()
                             return state, params
 
-            for button in buttons:
-                if button.hovering(mouse):
-                    button.color = gc.UI_BUTTON_COLOR_HOVER
-                    surfaces.append(button.draw())
-                else:
-                    button.color = gc.UI_BUTTON_COLOR
-                    surfaces.append(button.draw())
-
-            for surface in surfaces:
-                self.SCREEN.blit(surface, (0, 0))
+            widgets.extend(self.update_hover(buttons, mouse))
 
-            surfaces = []
+    # Blocks until an event arrives or the idle timeout passes, so idle screens don't use the CPU
+    # Output: The list of events to handle
+    def wait_for_events(self):
+        event = pygame.event.wait(gc.IDLE_TIMEOUT)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
 
+    # Blits the widgets at their positions and presents them
+    # Input: The widgets, and whether the rest of the screen has to be presented as well
+    def present_widgets(self, widgets, everything=False):
+        rects = [widget.blit(self.SCREEN) for widget in widgets]
+        if everything:
             pygame.display.update()
+        else:
+            pygame.display.update(rects)
+
+    # Sets the hover colour of the buttons under the cursor
+    # Output: The buttons that changed colour
+    def update_hover(self, buttons, mouse):
+        changed = []
+        for button in buttons:
+            if button.hovering(mouse):
+                color = gc.UI_BUTTON_COLOR_HOVER
+            else:
+                color = gc.UI_BUTTON_COLOR
+            if button.color != color:
+                button.color = color
+                changed.append(button)
+        return changed
 
     # Start in the initial state if running validation
     def set_initial_state(self, initial_points, initial_paths):
@@ -313,8 +362,21 @@ class Main:
             self.paths.append(end_path)
 
         self.points = set(initial_points)
+        self.spatial_hash = SpatialHash()
+        for point in self.points:
+            self.spatial_hash.update(point)
         GraphicsPoint.setLastID(len(self.points))
 
+        self.static_layer = pygame.Surface(self.SCREEN.get_size())
+        self.update_static_layer()
+
+        self.profiler = Profiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+        # A game started after game over was not reset, its worker thread is stopped here
+        if self.validator:
+            self.validator.shutdown()
+        self.validator = MoveValidator(self.validate_path)
+
     # Validates file given filename
     def validation(self, filename):
         # Alerts, invalid path - non, planar
@@ -326,12 +388,12 @@ class Main:
             error_label = Label(270, 300, 400, 50, gc.UI_BUTTON_COLOR, gc.UI_BUTTON_BORDER_COLOR, 2, str(error), 22,
                                 gc.UI_BUTTON_TEXT_COLOR)
 
-            self.SCREEN.blit(error_label.draw(), (0, 0))
+            error_label.blit(self.SCREEN)
 
             return (State.MAIN_MENU, [True])
 
     def draw_background(self):
-        bg = pygame.image.load("../../res/sproutsbg.png")
+        bg = assets.image(assets.BACKGROUND_IMAGE, self.SCREEN.get_size())
 
         self.SCREEN.fill(gc.WHITE)
         self.SCREEN.blit(bg, (0, 0))
@@ -355,6 +417,8 @@ class Main:
 
     # change the players turns
     def change_turn(self, label_1, label_2):
+        self.renderer.mark(label_1.rect)
+        self.renderer.mark(label_2.rect)
         if self.PLAYER == Player.PLAYER_1:
             label_1.border_color = gc.PLAYER_1_COLOR
             label_2.border_color = gc.BLACK
@@ -382,20 +446,28 @@ class Main:
         player_2_label = Label(gc.WINDOW_WIDTH - 60, 0, 60, 30, gc.PLAYER_2_COLOR, gc.PLAYER_2_COLOR, 2, "Player 2", 20,
                                gc.UI_BUTTON_TEXT_COLOR)
 
-        surfaces = []
+        labels = [legend, player_1_label, player_2_label]
 
-        surfaces.extend([legend.draw(), player_1_label.draw(), player_2_label.draw()])
+        # Shown while a move is validated on the worker thread
+        pending_label = Label(gc.WINDOW_WIDTH / 2 - 100, 30, 200, 30, gc.WHITE, gc.LINE_COLOR, 2, "Validating move...", 20,
+                              gc.UI_BUTTON_TEXT_COLOR)
 
         if self.game_over(self.base_region):
             self.update_screen([])
             return (State.GAME_OVER, [initial_points, initial_paths])
 
+        self.renderer.mark_all()
+        self.renderer.present(lambda: self.update_screen(labels))
+        preview_changed = False
+
         while True:
+            # Block until something happens, instead of redrawing an unchanged screen
+            events = self.wait_for_events()
+            frame_start = time.perf_counter()
             current_mouse_pos = pygame.mouse.get_pos()
+            was_pending = self.validator.busy()
 
-            surfaces.extend([legend.draw(), player_1_label.draw(), player_2_label.draw()])
-
-            for event in pygame.event.get():
+            for event in events:
                 # exit via X in window corner
                 if event.type == pygame.QUIT:
                     sys.exit()
@@ -408,15 +480,26 @@ class Main:
 
                     self.key_event_handler(event)
 
-                # mouse clicked
-                if event.type == pygame.MOUSEBUTTONDOWN:
+                # validation of a move finished on the worker thread
+                if event.type == VALIDATION_DONE:
+                    result = self.validator.result()
+                    if result:
+                        self.mark_preview()
+                        preview_changed = True
+                        if self.apply_validation(result, player_1_label, player_2_label):
+                            self.update_screen([])
+                            return (State.GAME_OVER, [initial_points, initial_paths])
+
+                # mouse clicked, ignored until the pending move is validated
+                if event.type == pygame.MOUSEBUTTONDOWN and not self.validator.busy():
                     mouse_point = Point(*event.pos)
-                    current_region = self.base_region.find_region(Point(*event.pos))
 
                     # p is a Point if collision exists, else None
-                    p = self.point_collision(current_region.game_points, event.pos)
+                    p = self.point_collision(event.pos)
 
-                    self.update_screen(surfaces)
+                    # The preview path and intersections may change, redraw where they are now and after the click
+                    self.mark_preview()
+                    preview_changed = True
 
                     # right click = suggest a path (if point pressed is GraphicsPoint
                     if event.button == 3 and p:
@@ -435,7 +518,10 @@ class Main:
                             self.change_turn(player_1_label, player_2_label)
 
                             # check for game over state
-                            if self.game_over(self.base_region):
+                            with self.profiler.measure("game_over"):
+                                game_over = self.game_over(self.base_region)
+                            self.profiler.end_move()
+                            if game_over:
                                 self.update_screen([])
                                 return (State.GAME_OVER, [initial_points, initial_paths])
 
@@ -469,41 +555,75 @@ class Main:
                         self.preview_points.append(p)
                         self.preview_path = Path.from_points(self.preview_points)
 
-                        (self.all_intersections, valid_path) = self.validate_path(self.preview_path)
+                        # Validate against a snapshot on the worker thread, the result arrives as VALIDATION_DONE
+                        self.creating_path = False
+                        self.validator.submit(self.preview_path, self.preview_points, list(self.paths),
+                                              PointSnapshot(self.points))
+                        break
 
-                        # path is not valid, show intersections
-                        if not valid_path:
-                            self.creating_path = False
-                            self.preview_path.change_color(gc.RED)
+            if preview_changed:
+                self.mark_preview()
+                preview_changed = False
 
-                            self.all_intersections = self.points_to_graphicspoints(self.all_intersections, gc.BLACK, 5)
-                            self.soft_reset()
-                            break
+            if self.validator.busy() != was_pending:
+                self.renderer.mark(pending_label.rect)
 
-                        # Split path in two and calculate new point
-                        self.finalize_path(self.preview_points)
+            # Update the preview path if the cursor has moved
+            if last_mouse_pos != current_mouse_pos:
+                last_mouse_pos = current_mouse_pos
+                if self.preview_points and self.creating_path:
+                    cur_point = Point(*current_mouse_pos)
+                    self.renderer.mark(self.preview_path.redraw(self.preview_points + [cur_point], self.get_color()))
+
+            # A wake up without events or changes only waited for the idle timeout, it is not counted as a frame
+            # Refreshing the profiler overlay alone doesn't make it one either
+            is_frame = bool(events) or bool(self.renderer.dirty)
+
+            # The profiler numbers change every frame
+            if self.profiler_overlay.visible:
+                self.renderer.mark(self.profiler_overlay.rect)
+                drawn_labels = labels + [self.profiler_overlay]
+            else:
+                drawn_labels = labels
+            if self.validator.busy():
+                drawn_labels = drawn_labels + [pending_label]
+
+            # Redraw and present only the areas that changed
+            self.renderer.present(lambda: self.update_screen(drawn_labels))
+            if is_frame:
+                self.profiler.frame(time.perf_counter() - frame_start)
+
+            # limits fps while events keep arriving
+            self.CLOCK.tick(gc.FPS)
 
-                        self.change_turn(player_1_label, player_2_label)
-                        if self.game_over(self.base_region):
-                            self.update_screen([])
-                            return (State.GAME_OVER, [initial_points, initial_paths])
+    # Applies the result of validating a move. A valid path is added to the game, an invalid one is shown with its
+    # intersections
+    # Input: The result of the validator, and the labels of the players
+    # Output: True if the game is over after the move
+    def apply_validation(self, result, label_1, label_2):
+        path, path_points, intersections, valid_path, seconds = result
+        self.profiler.begin_move()
+        self.profiler.record("validate_path", seconds)
+        self.all_intersections = intersections
 
-                        self.soft_reset()
+        # path is not valid, show intersections
+        if not valid_path:
+            path.change_color(gc.RED)
 
-            if self.preview_points and self.creating_path:
-                cur_point = Point(*pygame.mouse.get_pos())
-                self.preview_path.redraw(self.preview_points + [cur_point], self.get_color())
+            self.all_intersections = self.points_to_graphicspoints(self.all_intersections, gc.BLACK, 5)
+            self.soft_reset()
+            return False
 
-            # Update the screen if the cursor has moved
-            if last_mouse_pos != current_mouse_pos:
-                self.SCREEN.fill(gc.BACKGROUND_COLOR)
-                last_mouse_pos = current_mouse_pos
-                self.update_screen(surfaces)
-                pygame.display.update()
+        # Split path in two and calculate new point
+        self.finalize_path(path_points)
 
-            surfaces = []
-            # controls fps
-            self.CLOCK.tick(gc.FPS)
+        self.change_turn(label_1, label_2)
+        with self.profiler.measure("game_over"):
+            game_over = self.game_over(self.base_region)
+        self.profiler.end_move()
+
+        self.soft_reset()
+        return bool(game_over)
 
     def update_preview(self, preview_points, cur_point):
         for p in preview_points:
@@ -525,6 +645,7 @@ class Main:
 
         searching = True
         canceled = False
+        self.profiler.begin_move()
 
         while searching:
             self.update_screen([])
@@ -537,11 +658,15 @@ class Main:
                 canceled = True
                 break
 
-            (self.all_intersections, valid_path) = self.validate_path(suggested_path)
+            with self.profiler.measure("validate_path"):
+                (self.all_intersections, valid_path) = self.validate_path(suggested_path)
             self.all_intersections = self.points_to_graphicspoints(self.all_intersections, gc.BLACK, 5)
             if valid_path:
                 searching = False
 
+        # The search tree was drawn directly on the screen
+        self.renderer.mark_all()
+
         if canceled:
             return []
         else:
@@ -553,79 +678,88 @@ class Main:
                 return False
         return self.shares_region(p1, p2)
 
-    def validate_path(self, path: Path) -> Tuple[List[Point], bool]:
-        valid_path = True
-        all_intersections = []
-
-        # if preview_path.start_point == preview_path.end_point and (len(preview_path.start_point.paths) + 2 >= 3):
-        if path.start_point.equals(path.end_point):
-            if path.start_point.num_paths + 2 > 3:
-                valid_path = False
-                print("too many connections")
-
-        # Does created path collide with existing paths, and if so, where
-        for p in self.paths:
-            intersections = path.intersects(p)
-            if intersections:
-                all_intersections.extend(intersections)
-                valid_path = False
-                print("collides with existing paths")
-
-        self_intersections = path.self_intersections()
-        if self_intersections:
-            all_intersections.extend(self_intersections)
-            valid_path = False
-            print("collides with itself")
-
-        # If the path is still valid, test if it intersects with any points
-        if valid_path:
-            for point in self.points:
-                if path.point_touches_path(point):
-                    all_intersections.append(point)
-                    valid_path = False
-                    print("collides existing points")
-        return all_intersections, valid_path
-
-    def update_screen(self, surfaces):
-        # Clear the current screen
-        self.SCREEN.fill(gc.BACKGROUND_COLOR)
-
-        # draw paths and points
+    # Tests if a path can be added to the game
+    # Input: The path, and optionally a snapshot of the paths and points to test against. Defaults to the current game
+    # Output: The points where the path collides, and whether the path is valid
+    def validate_path(self, path: Path, paths=None, point_snapshot=None) -> Tuple[List[Point], bool]:
+        if paths is None:
+            paths = self.paths
+        if point_snapshot is None:
+            point_snapshot = PointSnapshot(self.points)
+
+        return validate_path(path, paths, point_snapshot)
+
+    # Redraws the committed paths and points on the static layer, within the given areas or everywhere
+    # The areas are marked as changed on the screen as well
+    def update_static_layer(self, rects=None):
+        if rects is None:
+            rects = [self.static_layer.get_rect()]
+        for rect in rects:
+            self.static_layer.set_clip(rect)
+            self.static_layer.fill(gc.BACKGROUND_COLOR)
+            self.draw_sprites(self.paths, self.static_layer)
+            self.draw_points(self.points, self.static_layer)
+            self.renderer.mark(rect)
+        self.static_layer.set_clip(None)
+
+    def update_screen(self, labels):
+        # Committed paths and points are drawn from the static layer
+        self.SCREEN.blit(self.static_layer, (0, 0))
+
+        # draw the path being created and the intersections of an invalid path
         if self.preview_path:
             self.preview_path.draw(self.SCREEN)
+        self.draw_points(self.all_intersections)
 
-        # Draw the objects
-        self.draw_sprites(self.paths)
-        self.draw_sprites(self.points)
-        self.draw_sprites(self.all_intersections)
+        for label in labels:
+            label.blit(self.SCREEN)
 
-        for surface in surfaces:
-            self.SCREEN.blit(surface, (0, 0))
+    # Marks the areas covered by the preview path and the shown intersections as changed
+    def mark_preview(self):
+        if self.preview_path:
+            self.renderer.mark(self.preview_path.bounds())
+        for intersection in self.all_intersections:
+            self.renderer.mark(point_bounds(intersection))
 
-    def draw_sprites(self, sprites):
+    def draw_sprites(self, sprites, surf=None):
+        if surf is None:
+            surf = self.SCREEN
         sprites = list(sprites)
         # Reversed to draw paths before points
         for sprite in reversed(sprites):
-            sprite.draw(self.SCREEN)
+            sprite.draw(surf)
+
+    def draw_points(self, points, surf=None):
+        if surf is None:
+            surf = self.SCREEN
+        for point in points:
+            draw_point(point, surf)
 
     def key_event_handler(self, event):
-        # Enter pressed
-        if event.key == pygame.K_RETURN:
+        # Enter pressed, unless a pending move is validated without the new point
+        if event.key == pygame.K_RETURN and not self.validator.busy():
             new_point = GraphicsPoint(random.randrange(0, gc.WINDOW_WIDTH), random.randrange(0, gc.WINDOW_HEIGHT), True)
             self.base_region.add_point(new_point)
+            self.spatial_hash.insert(new_point)
+            self.points.add(new_point)
+            self.update_static_layer([point_bounds(new_point)])
+        # Show or hide the profiler overlay
+        if event.key == pygame.K_F3:
+            self.profiler_overlay.toggle()
+            self.renderer.mark(self.profiler_overlay.rect)
+        # Write the profiled frame and move times to a file
+        if event.key == pygame.K_F4:
+            self.profiler.dump_csv(gc.PROFILE_FILE)
         # ESC pressed
         if event.key == pygame.K_ESCAPE:
+            self.validator.cancel()
+            self.mark_preview()
             self.preview_path = None
-            self.update_screen([])
-            pygame.display.update()
             self.soft_reset()
 
-    def point_collision(self, points, pos):
-        for point in points:
-            if (point.rect.collidepoint(pos)
-                    and point.available()):
-                return point
-        return None
+    # Returns an available point under the cursor, or None
+    def point_collision(self, pos):
+        return self.spatial_hash.point_at(pos)
 
     def points_to_graphicspoints(self, points, color=gc.POINT_COLOR, radius=9):
         lst = []
@@ -649,18 +783,29 @@ class Main:
         # self.all_intersections = []
 
     def finalize_path(self, path_points):
-        (start_path, end_path, mid_point) = add_path(path_points[0],
-                                                     path_points[-1],
-                                                     path_points)
+        with self.profiler.measure("add_path"):
+            (start_path, end_path, mid_point) = add_path(path_points[0],
+                                                         path_points[-1],
+                                                         path_points)
 
-        current_region = self.base_region.find_region(mid_point)
+        with self.profiler.measure("update_region_tree"):
+            current_region = self.base_region.find_region(mid_point)
 
-        # Add the paths to the region
-        current_region.update_region_tree([start_path, end_path], mid_point)
+            # Add the paths to the region
+            current_region.update_region_tree([start_path, end_path], mid_point)
 
         self.paths.extend([start_path, end_path])
         self.points.add(mid_point)
 
+        # The end points may have become unavailable
+        for point in [path_points[0], path_points[-1], mid_point]:
+            self.spatial_hash.update(point)
+
+        # Redraw the new paths, and the points that got a path (and possibly a new colour)
+        changed = [start_path.bounds(), end_path.bounds()]
+        changed.extend(point_bounds(point) for point in [path_points[0], path_points[-1], mid_point])
+        self.update_static_layer(changed)
+
 
 if __name__ == "__main__":
     # Change working directory from Fagprojekt-sprouts to main
@@ -0,0 +1,52 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+VALIDATION_DONE = pygame.USEREVENT + 1  # Posted when the validation of a move has finished
+THREAD_NAME = "move-validator"          # Name of the worker threads
+
+
+### MAIN RESPONSIBILITY: THOMAS AAMAND WITTING S184192 ###
+# Validates the path of a move on a worker thread, so the game loop keeps handling events in the meantime.
+# The worker only reads the paths of the game, which are not changed once added, and a snapshot of the points with
+# copied positions, radii and numbers of paths. The model is changed by the game loop when the result is applied
+class MoveValidator:
+    def __init__(self, validate):
+        self.validate = validate
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=THREAD_NAME)
+        self.pending = None
+
+    def busy(self):
+        return self.pending is not None
+
+    # Starts validating the path of a move. A VALIDATION_DONE event is posted when the result is ready
+    # Input: The path, the clicked points it was made from, and the snapshot of the paths and points to validate against
+    # Output: None
+    def submit(self, path, path_points, paths, point_snapshot):
+        future = self.executor.submit(self.timed_validate, path, paths, point_snapshot)
+        future.add_done_callback(lambda _: pygame.event.post(pygame.event.Event(VALIDATION_DONE)))
+        self.pending = (future, path, path_points)
+
+    def timed_validate(self, path, paths, point_snapshot):
+        start = time.perf_counter()
+        intersections, valid_path = self.validate(path, paths, point_snapshot)
+        return intersections, valid_path, time.perf_counter() - start
+
+    # Output: (path, path points, intersections, valid, seconds spent) if the pending move is validated, else None
+    def result(self):
+        if self.pending is None or not self.pending[0].done():
+            return None
+        future, path, path_points = self.pending
+        self.pending = None
+        intersections, valid_path, seconds = future.result()
+        return path, path_points, intersections, valid_path, seconds
+
+    # Forgets the pending move, its result is ignored when it arrives
+    def cancel(self):
+        self.pending = None
+
+    # Stops the worker thread once it is idle. A validation that has not started yet is not run
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
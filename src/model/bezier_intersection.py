@@ -163,11 +163,11 @@ class Segment(ImplicitLine):
 
     # Does the point lie over the segment?
     def over_segment(self, point: Point) -> bool:
-        delta_point_start = point - self.start_point
-        delta_point_end = point - self.end_point
-        delta_segment = self.end_point - self.start_point
+        start_x, start_y = point.sub_pos(self.start_point)
+        end_x, end_y = point.sub_pos(self.end_point)
+        segment_x, segment_y = self.end_point.sub_pos(self.start_point)
 
-        return delta_segment.dot_product(delta_point_start) * (-delta_segment.dot_product(delta_point_end)) >= 0
+        return (segment_x * start_x + segment_y * start_y) * (-(segment_x * end_x + segment_y * end_y)) >= 0
 
 
 # Creates a convex hull of N points, where the points are sorted by x-value
@@ -261,6 +261,15 @@ class Bezier:
                         parameter_stack.append((t_min, t_max, u_min, u_max))
         return intersections
 
+    # Returns a rectangle covering the curve, which lies within the bounding box of its control points
+    def bounding_rect(self, margin=0) -> pygame.Rect:
+        x_values = [self.start_point.x, self.end_point.x, self.control_point_1.x, self.control_point_2.x]
+        y_values = [self.start_point.y, self.end_point.y, self.control_point_1.y, self.control_point_2.y]
+
+        left = int(min(x_values)) - margin
+        top = int(min(y_values)) - margin
+        return pygame.Rect(left, top, int(max(x_values)) + margin + 1 - left, int(max(y_values)) + margin + 1 - top)
+
     # Computes the area bounding box of the bezier
     def bounding_box_area(self) -> float:
         x_values = [self.start_point.x, self.end_point.x, self.control_point_1.x, self.control_point_2.x]
@@ -290,14 +299,14 @@ class Bezier:
             uy = vy
         return ux + uy <= tolerance  # tolerance is 16*(inaccuracy in pixels)^2
 
-    # Approximate a Bezier curve as a set of polygonal lines
-    def approximate_bezier(self):
-        if (self.sufficient_approximation(1)):  # Make global/or class local tolerance constant
+    # Approximate a Bezier curve as a set of polygonal lines, no further than tolerance pixels from the curve
+    def approximate_bezier(self, tolerance=1):
+        if (self.sufficient_approximation(tolerance)):
             return [self.start_point, self.end_point]  # As list
         else:
             new_curves = self.split(0.5)
-            lh_list = new_curves[0].approximate_bezier()
-            rh_list = new_curves[1].approximate_bezier()
+            lh_list = new_curves[0].approximate_bezier(tolerance)
+            rh_list = new_curves[1].approximate_bezier(tolerance)
             return lh_list + rh_list[1:]
 
 
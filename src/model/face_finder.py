@@ -11,10 +11,10 @@ from src.model.point import Point
 # Computes the angle between 2 segments
 def segment_angle(seg_a: Segment, seg_b: Segment) -> float:
     # Assume that the start_points of the segments are shared
-    delta_a = seg_a.end_point - seg_a.start_point
-    delta_b = seg_b.end_point - seg_b.start_point
+    delta_a_x, delta_a_y = seg_a.end_point.sub_pos(seg_a.start_point)
+    delta_b_x, delta_b_y = seg_b.end_point.sub_pos(seg_b.start_point)
 
-    angle = math.atan2(delta_a.y, delta_a.x) - math.atan2(delta_b.y, delta_b.x)
+    angle = math.atan2(delta_a_y, delta_a_x) - math.atan2(delta_b_y, delta_b_x)
 
     if angle < 0:
         return angle + 2 * math.pi
@@ -29,12 +29,12 @@ def went_from_start_to_end(path: Path, came_from: Point) -> int:
 
 
 def find_path_segment(path: Path, point: Point) -> Segment:
-    approximation = path.approximate()
+    approximation = path.approximation_array()
 
     if path.start_point == point:
-        return Segment(point, approximation[1])
+        return Segment(point, Point(*approximation[1].tolist()))
     else:
-        return Segment(point, approximation[-2])
+        return Segment(point, Point(*approximation[-2].tolist()))
 
 
 # Finds the cycles bounding the faces of the graph, given the starting point, and the adjacencylist/edgemap
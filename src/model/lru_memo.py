@@ -0,0 +1,41 @@
+from collections import OrderedDict
+
+MAX_SIZE = 4096  # Number of results kept before the least recently used ones are dropped
+
+
+### MAIN RESPONSIBILITY: BJÖRN WILTING S184214 ###
+# Bounded memo of computed results, forgetting the least recently used result when it is full
+# Keys must contain everything the result depends on, as results are never invalidated, only pushed out
+class LRUMemo:
+    MISSING = object()  # Returned by get for keys without a result
+
+    def __init__(self, max_size=MAX_SIZE):
+        self.max_size = max_size
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.results)
+
+    # Returns the result stored for the key, or LRUMemo.MISSING
+    def get(self, key):
+        result = self.results.get(key, LRUMemo.MISSING)
+        if result is LRUMemo.MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.results.move_to_end(key)
+        return result
+
+    # Stores the result for the key, dropping the least recently used result if the memo is full
+    def put(self, key, result):
+        self.results[key] = result
+        self.results.move_to_end(key)
+        if len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+    def clear(self):
+        self.results.clear()
+        self.hits = 0
+        self.misses = 0
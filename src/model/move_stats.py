@@ -0,0 +1,80 @@
+import time
+from contextlib import contextmanager
+
+_recorder = None  # The MoveStats recording the current moves, None while the instrumentation is off
+
+
+### MAIN RESPONSIBILITY: BJÖRN WILTING S184214 ###
+# Opt-in timing and counters of the phases of Region.update_region_tree, one record per move
+# A record is a dictionary {"phases": {name: seconds}, "counters": {name: count}, "tree_depth": depth}
+# Usage:
+#     with MoveStats() as stats:
+#         region.update_region_tree(paths, mid_point)
+#     stats.moves[-1]["counters"]["cycles"]
+class MoveStats:
+    def __init__(self):
+        self.moves = []
+        self.current = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Starts recording the moves made from now on
+    def start(self):
+        global _recorder
+        _recorder = self
+
+    def stop(self):
+        global _recorder
+        if _recorder is self:
+            _recorder = None
+
+    def begin_move(self):
+        self.current = {"phases": {}, "counters": {}, "tree_depth": 0}
+
+    def end_move(self, tree_depth):
+        self.current["tree_depth"] = tree_depth
+        self.moves.append(self.current)
+        self.current = None
+
+
+# Whether moves are being recorded
+def recording():
+    return _recorder is not None and _recorder.current is not None
+
+
+def begin_move():
+    if _recorder is not None:
+        _recorder.begin_move()
+
+
+# Finishes the record of the current move
+# Input: A function returning the depth of the region tree, only called when recording
+def end_move(tree_depth):
+    if recording():
+        _recorder.end_move(tree_depth())
+
+
+# Adds the time spent in the with block to the given phase of the current move
+@contextmanager
+def phase(name):
+    if not recording():
+        yield
+        return
+    phases = _recorder.current["phases"]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0) + time.perf_counter() - start
+
+
+# Adds to the given counter of the current move
+def count(name, amount=1):
+    if _recorder is not None and _recorder.current is not None:
+        counters = _recorder.current["counters"]
+        counters[name] = counters.get(name, 0) + amount
@@ -1,12 +1,16 @@
 from typing import List
 
+import numpy as np
 import pygame
 
 import src.config.game_config as gc
-from src.model.bezier_intersection import Segment
 from src.model.cubic_bezier import GraphicsBezier, Bezier
 from src.model.point import Point, GraphicsPoint
 
+APPROXIMATION_TOLERANCE = 1  # Maximum distance in pixels between a path and its exact approximation
+COARSE_TOLERANCE = 8  # Maximum distance in pixels between a path and its broad-phase approximation
+LINE_MARGIN = 3  # Distance in pixels the drawn lines can cover outside the curves
+
 ### MAIN RESPONSIBILITY FOR INTERSECTION FUNCTIONS: OLAV NØRGAARD OLSEN S184195 ###
 ### MAIN RESPONSIBILITY FOR CALCULATING BEZIERS/CONTROL POINTS: THOMAS AAMAND WITTING S184192 ###
 class Path:
@@ -27,7 +31,8 @@ class Path:
         self.start_point = start_point
         self.end_point = end_point
         self._clicks = []
-        self.approximation = []
+        # Approximations of the path as (n, 2) float arrays, keyed by tolerance. Computed on request
+        self._approximations = {}
 
         for b in self.beziers:
             if isinstance(b, GraphicsBezier):
@@ -41,6 +46,13 @@ class Path:
     def draw(self, surf):
         surf.blit(self.image, self.rect)
 
+    # Returns the area of the screen covered by the given beziers of the path, all of them by default
+    def bounds(self, beziers=None) -> pygame.Rect:
+        if beziers is None:
+            beziers = self.beziers
+        rects = [b.bounding_rect(LINE_MARGIN) for b in beziers]
+        return rects[0].unionall(rects[1:])
+
     def get_other_point(self, p):
         if p == self.start_point:
             return self.end_point
@@ -69,21 +81,32 @@ class Path:
         else:
             return "start: " + str(self.start_point.index) + ", end: " + str(self.end_point.index)
 
-    # Returns a list of points, as an approximation of the path
-    def approximate(self) -> List[Point]:
-        if not self.approximation:
-            point_list = self.beziers[0].approximate_bezier()
+    # Returns the approximation of the path as an (n, 2) array of floats, which is no further than tolerance pixels
+    # from the path. Each tolerance level is computed once, the first time it is requested
+    def approximation_array(self, tolerance=APPROXIMATION_TOLERANCE) -> np.ndarray:
+        approximation = self._approximations.get(tolerance)
+        if approximation is None:
+            point_list = self.beziers[0].approximate_bezier(tolerance)
             for curve in self.beziers[1:]:
-                curve_points = curve.approximate_bezier()
-                if curve_points[0] == point_list[-1]:
+                curve_points = curve.approximate_bezier(tolerance)
+                if curve_points[0].equals(point_list[-1]):
                     point_list.extend(curve_points[1:])
                 else:
                     point_list.extend(curve_points)
-            self.approximation = point_list
-        return self.approximation
+            approximation = np.array([p.pos() for p in point_list], dtype=float)
+            self._approximations[tolerance] = approximation
+        return approximation
+
+    # Returns a new list of points, as an approximation of the path. The first and last point are the end points
+    # of the path itself
+    def approximate(self, tolerance=APPROXIMATION_TOLERANCE) -> List[Point]:
+        approximation = self.approximation_array(tolerance)
+        point_list = [Point(x, y) for x, y in approximation[1:-1].tolist()]
+        return [self.beziers[0].start_point] + point_list + [self.beziers[-1].end_point]
 
     # assumes that only the last 2 (?) points have been changed
-    def redraw(self, clicks, color):
+    # Returns the area of the screen that changed
+    def redraw(self, clicks, color) -> pygame.Rect:
         compute_all = False
         if len(clicks) - 1 > len(self._clicks):
             self._clicks = clicks[:-1]
@@ -92,41 +115,64 @@ class Path:
 
         if len(clicks) > 4:
             if compute_all:
+                dirty = self.bounds()
                 new_beziers = compute_graphics_beziers(clicks, color)
                 self.beziers = new_beziers
+                dirty.union_ip(self.bounds())
             else:
                 clicks = clicks[-4:]
                 new_beziers = compute_graphics_beziers(clicks, color)
+                dirty = self.bounds(self.beziers[-len(new_beziers) + 1:])
                 self.beziers[-len(new_beziers) + 1:] = new_beziers[1:]
+                dirty.union_ip(self.bounds(new_beziers[1:]))
         else:
+            dirty = self.bounds()
             new_beziers = compute_graphics_beziers(clicks, color)
             self.beziers = new_beziers
+            dirty.union_ip(self.bounds())
 
+        self._approximations = {}
         self.image.fill(gc.WHITE)
         for b in self.beziers:
             self.image.blit(b.image, (0, 0))
+        return dirty
 
-    def point_touches_path(self, point: GraphicsPoint) -> bool:
-        approximation = self.approximate()
-
+    # Tests if the circle of a point touches the path, the radius defaults to the radius of the point
+    def point_touches_path(self, point: Point, radius=None) -> bool:
         if point.equals(self.start_point) or point.equals(self.end_point):
             return False
+        if radius is None:
+            radius = point.radius
+
+        # Broad phase: every point of the exact approximation lies within both tolerances of the coarse one
+        margin = radius + COARSE_TOLERANCE + APPROXIMATION_TOLERANCE
+        if polyline_distance_sq(self.approximation_array(COARSE_TOLERANCE), point) >= margin * margin:
+            return False
 
-        for i in range(len(approximation) - 1):
-            segment_start = approximation[i]
-            segment_end = approximation[i + 1]
+        approximation = self.approximation_array()
+        segment_start = approximation[:-1]
+        segment_end = approximation[1:]
+        delta = segment_end - segment_start
+        delta_start = (point.x - segment_start[:, 0], point.y - segment_start[:, 1])
+        delta_end = (point.x - segment_end[:, 0], point.y - segment_end[:, 1])
 
-            if segment_start.distance_sq(self.start_point) < 81 and point.distance_sq(self.start_point) < 81:
-                continue
-            if segment_end.distance_sq(self.end_point) < 81 and point.distance_sq(self.end_point) < 81:
-                continue
+        # Segments close to an end point are ignored, if the point is close to the same end point
+        skip = np.zeros(len(delta), dtype=bool)
+        if point.distance_sq(self.start_point) < 81:
+            skip |= squared_distances(segment_start, self.start_point) < 81
+        if point.distance_sq(self.end_point) < 81:
+            skip |= squared_distances(segment_end, self.end_point) < 81
 
-            segment = Segment(segment_start, segment_end)
+        # Does the point lie over the segment (see Segment.over_segment)
+        over_segment = (delta[:, 0] * delta_start[0] + delta[:, 1] * delta_start[1]) * \
+                       -(delta[:, 0] * delta_end[0] + delta[:, 1] * delta_end[1]) >= 0
 
-            if segment.over_segment(point):
-                if abs(segment.dist(point)) < point.radius:
-                    return True
-        return False
+        # Distance to the line through the segment is less than the radius, compared without the square root
+        length_sq = delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1]
+        cross = delta[:, 0] * delta_start[1] - delta[:, 1] * delta_start[0]
+        touches = cross * cross < radius * radius * length_sq
+
+        return bool(np.any(~skip & over_segment & (length_sq > 0) & touches))
 
     def intersects_bezier(self, bez: Bezier):
         intersections = []
@@ -211,6 +257,25 @@ class Path:
         return "Path(%d,%d)" % (self.start_point.index, self.end_point.index)
 
 
+# Squared distances from every row of an (n, 2) array to a point
+def squared_distances(points: np.ndarray, point: Point) -> np.ndarray:
+    delta_x = points[:, 0] - point.x
+    delta_y = points[:, 1] - point.y
+    return delta_x * delta_x + delta_y * delta_y
+
+
+# Squared distance from a point to the closest segment of a polyline, given as an (n, 2) array
+def polyline_distance_sq(polyline: np.ndarray, point: Point) -> float:
+    segment_start = polyline[:-1]
+    delta = polyline[1:] - segment_start
+    length_sq = delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1]
+    t = (point.x - segment_start[:, 0]) * delta[:, 0] + (point.y - segment_start[:, 1]) * delta[:, 1]
+    t = np.clip(np.divide(t, length_sq, out=np.zeros_like(t), where=length_sq > 0), 0, 1)
+    delta_x = segment_start[:, 0] + t * delta[:, 0] - point.x
+    delta_y = segment_start[:, 1] + t * delta[:, 1] - point.y
+    return float(np.min(delta_x * delta_x + delta_y * delta_y))
+
+
 # Method as described in https://www.youtube.com/watch?v=nNmFLWup4_k 7m50s
 def calc_control_points(start, middle, end):
     # Compute vectors to next and previous anchor point
@@ -218,12 +283,15 @@ def calc_control_points(start, middle, end):
     diff_vec_2 = end - middle
 
     # Compute control points as tangents
-    dir_vec_1_normalized = diff_vec_1.normalized() - diff_vec_2.normalized()
+    dir_vec_1_normalized = diff_vec_1.normalized()
+    dir_vec_1_normalized -= diff_vec_2.normalized()
     dir_vec_2_normalized = -dir_vec_1_normalized
 
     # Scale control points accordingly
-    control_point_1 = dir_vec_1_normalized.scalar(diff_vec_1.length() / 5) + middle
-    control_point_2 = dir_vec_2_normalized.scalar(diff_vec_2.length() / 5) + middle
+    control_point_1 = dir_vec_1_normalized.scalar_ip(diff_vec_1.length() / 5)
+    control_point_1 += middle
+    control_point_2 = dir_vec_2_normalized.scalar_ip(diff_vec_2.length() / 5)
+    control_point_2 += middle
 
     return control_point_1, control_point_2
 
@@ -0,0 +1,49 @@
+from typing import List, Tuple
+
+from src.model.path import Path
+from src.model.point import Point
+
+
+### MAIN RESPONSIBILITY: OLAV NØRGAARD OLSEN S184195 ###
+# Tests whether a path may be added to the game: a point keeps at most three paths, and the path may not intersect
+# the other paths, itself or the game points it passes
+# Used by the game and by the region benchmark, so both run the same checks
+# Input: The path, the paths of the game and a snapshot of its points
+# Output: The intersections found, and whether the path is valid
+def validate_path(path: Path, paths, point_snapshot) -> Tuple[List[Point], bool]:
+    valid_path = True
+    all_intersections = []
+
+    # if preview_path.start_point == preview_path.end_point and (len(preview_path.start_point.paths) + 2 >= 3):
+    if path.start_point.equals(path.end_point):
+        if point_snapshot.degree(path.start_point) + 2 > 3:
+            valid_path = False
+            print("too many connections")
+
+    # Does created path collide with existing paths, and if so, where
+    for p in paths:
+        intersections = path.intersects(p)
+        if intersections:
+            all_intersections.extend(intersections)
+            valid_path = False
+            print("collides with existing paths")
+
+    self_intersections = path.self_intersections()
+    if self_intersections:
+        all_intersections.extend(self_intersections)
+        valid_path = False
+        print("collides with itself")
+
+    # If the path is still valid, test if it intersects with any points near the path
+    if valid_path:
+        approximation = path.approximation_array()
+        min_x, min_y = approximation.min(axis=0)
+        max_x, max_y = approximation.max(axis=0)
+        positions, radii = point_snapshot.circles_in_box(min_x, min_y, max_x, max_y)
+        for (x, y), radius in zip(positions.tolist(), radii.tolist()):
+            point = Point(x, y)
+            if path.point_touches_path(point, radius):
+                all_intersections.append(point)
+                valid_path = False
+                print("collides existing points")
+    return all_intersections, valid_path
@@ -1,13 +1,18 @@
 import math
+import weakref
 
 import pygame
-from pygame import font
 
 import src.config.game_config as gc
+from src.model.snapshot import copy_on_write, created
 
 
 ### MAIN RESPONSIBILITY: THOMAS AAMAND WITTING S184192 ###
+# Points are compared and hashed by value. A point must therefore not be changed in place while it is used as a key
+# in a set or dictionary
 class Point:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -33,12 +38,46 @@ class Point:
     def __sub__(self, other):
         return Point(self.x - other.x, self.y - other.y)
 
+    def __iadd__(self, other):
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, other):
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, Point):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
     def __str__(self):
         return "Point(%s,%s)" % (self.x, self.y)
 
     def scalar(self, s):
         return Point(self.x * s, self.y * s)
 
+    # Scale in place
+    def scalar_ip(self, s):
+        self.x *= s
+        self.y *= s
+        return self
+
+    # Tuple-returning versions of +, - and scalar, for hot loops that only need the coordinates
+    def add_pos(self, other: 'Point'):
+        return self.x + other.x, self.y + other.y
+
+    def sub_pos(self, other: 'Point'):
+        return self.x - other.x, self.y - other.y
+
+    def scalar_pos(self, s):
+        return self.x * s, self.y * s
+
     def dot_product(self, other: 'Point'):
         return self.x * other.x + self.y * other.y
 
@@ -57,15 +96,17 @@ class Point:
 
     # Returns a new Point with length = 1
     def normalized(self):
-        if self.length() == 0:
-            return self.scalar(1)
-        return self.scalar(1 / self.length())
+        length = self.length()
+        if length == 0:
+            return Point(self.x, self.y)
+        return Point(self.x / length, self.y / length)
 
     # Normalize in place
     def normalized_ip(self):
-        tmp = self.normalized()
-        self.x = tmp.x
-        self.y = tmp.y
+        length = self.length()
+        if length != 0:
+            self.x /= length
+            self.y /= length
 
     def equals(self, point: 'Point'):
         if (self.x == point.x) and (self.y == point.y):
@@ -74,10 +115,45 @@ class Point:
             return False
 
 
+# The set of regions of a game point. Changes are recorded by the active snapshot of the region tree
+class RegionSet(set):
+    def __init__(self, point: 'GraphicsPoint'):
+        super().__init__()
+        self._point = weakref.ref(point)
+
+    def add(self, region):
+        copy_on_write(self._point())
+        super().add(region)
+
+    def remove(self, region):
+        copy_on_write(self._point())
+        super().remove(region)
+
+    def discard(self, region):
+        copy_on_write(self._point())
+        super().discard(region)
+
+    def clear(self):
+        copy_on_write(self._point())
+        super().clear()
+
+    # Replaces the regions without recording the change, used when a snapshot is restored
+    def reset(self, regions):
+        super().clear()
+        super().update(regions)
+
+
+# Game points are distinct objects, even when they share a position, so they keep identity equality and hashing
 class GraphicsPoint(Point):
     __lastId = 0
 
+    def __eq__(self, other):
+        return self is other
+
+    __hash__ = object.__hash__
+
     def __init__(self, x, y, index=True, paths=None):
+        created(self)
         super().__init__(x, y)
 
         if index:
@@ -92,19 +168,10 @@ class GraphicsPoint(Point):
         self.paths = paths
         self.radius = 9
         self.color = gc.POINT_COLOR
-        self.regions = set()
+        self.regions = RegionSet(self)
         self.num_paths = len(paths)
 
-        # Draw circle on own surface
-        self.image = pygame.Surface([self.radius * 2, self.radius * 2])
-        self.image.fill(gc.WHITE)
-
-        # All white is considered to be transparent
-        self.image.set_colorkey(gc.WHITE)
-
-        pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius)
-
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect(0, 0, self.radius * 2, self.radius * 2)
         self.update_rect()
 
     @classmethod
@@ -119,6 +186,7 @@ class GraphicsPoint(Point):
         return len(self.paths) < 3
 
     def add_to_path(self, path):
+        copy_on_write(self)
         self.paths.append(path)
         self.num_paths = len(self.paths)
         if self.num_paths >= 3:
@@ -130,26 +198,31 @@ class GraphicsPoint(Point):
 
     def update_color(self, color):
         self.color = color
-        self.image.fill(gc.WHITE)
-        pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius)
 
-        self.rect = self.image.get_rect()
-        self.update_rect()
+    # The state changed by moves, copied by snapshots of the region tree
+    def save_state(self):
+        return list(self.paths), self.num_paths, self.color, set(self.regions)
 
-    def draw(self, surf):
-        surf.blit(self.image, self.rect)
-        font = pygame.font.Font(pygame.font.get_default_font(), 16)
+    def restore_state(self, state):
+        paths, self.num_paths, self.color, regions = state
+        self.paths = list(paths)
+        self.regions.reset(regions)
+
+    # Gives back the index of a point created since a restored snapshot was taken
+    # The point must not be used afterwards
+    def discard(self):
+        if hasattr(self, 'index') and self.index == GraphicsPoint.__lastId - 1:
+            GraphicsPoint.__lastId -= 1
 
-        if hasattr(self, 'index'):
-            text_surface = font.render(str(self.index), True, (0, 0, 0))
-            surf.blit(text_surface, self.pos())
+    # Draws the point from the shared sprites of the ui. Imported here, so the model does not depend on the ui
+    def draw(self, surf):
+        from src.ui.sprite_cache import draw_point
+        draw_point(self, surf)
 
     def update_radius(self, radius):
         self.radius = radius
-        self.image.fill(gc.WHITE)
-        pygame.draw.circle(self.image, self.color, (self.radius, self.radius), radius)
-
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect(0, 0, self.radius * 2, self.radius * 2)
         self.update_rect()
+
     def __str__(self):
         return "GraphicsPoint(%s,%s), id: %d" % (self.x, self.y, self.index)
@@ -1,33 +1,326 @@
-from src.model.bezier_intersection import ImplicitLine
+import numpy as np
+
+from src.model.point import Point
+
+ON_EDGE_TOLERANCE = 1e-6  # Distance below which a point is considered to be on an edge
+SIMPLIFY_TOLERANCE = 4.0  # Largest distance in pixels between a border and its simplification
+SOLVE_STEPS = 60  # Steps at most when solving where a curve crosses the ray of a point
+SOLVE_TOLERANCE = 1e-9  # Distance in y at which a crossing is considered found
+
 
 ### MAIN RESPONSIBILITY: BJÖRN WILTING S184214 ###
-#The class contains helper functions that execute parts of the winding numbers algorithm
+# The edges of a polygon, with everything the winding number needs that does not depend on the query point
+# Computed once, as the border of a region never changes after the region is created
+class EdgeTable:
+    def __init__(self, border: np.ndarray):
+        start = border
+        end = np.roll(border, -1, axis=0)
+        edge = end - start
+
+        self.start_x = start[:, 0]
+        self.start_y = start[:, 1]
+        self.edge_x = edge[:, 0]
+        self.edge_y = edge[:, 1]
+        self.y_min = np.minimum(start[:, 1], end[:, 1])
+        self.y_max = np.maximum(start[:, 1], end[:, 1])
+
+        # Horizontal edges, including edges of length 0, never cross the ray of a point
+        self.skip = self.edge_y == 0
+        self.inverse_slope = self.edge_x / np.where(self.skip, 1, self.edge_y)
+        # Upward edges (decreasing y on the screen) count 1, downward edges -1
+        self.direction = np.where(self.edge_y < 0, 1, -1)
+
+        length_sq = self.edge_x * self.edge_x + self.edge_y * self.edge_y
+        self.inverse_length_sq = np.divide(1, length_sq, out=np.zeros_like(length_sq), where=length_sq > 0)
+
+        # The same values per edge as plain floats, for testing single points against the few edges near them
+        self.rows = list(zip(self.start_x.tolist(), self.start_y.tolist(), self.edge_x.tolist(), self.edge_y.tolist(),
+                             self.y_min.tolist(), self.y_max.tolist(), self.skip.tolist(),
+                             self.inverse_slope.tolist(), self.direction.tolist(), self.inverse_length_sq.tolist()))
+
+    def __len__(self):
+        return len(self.rows)
+
+    # Returns the indices of the edges whose y-range, widened by the tolerance, contains the given y
+    def near(self, y, tolerance=ON_EDGE_TOLERANCE):
+        return np.flatnonzero((self.y_min - tolerance <= y) & (y <= self.y_max + tolerance)).tolist()
+
+
+# Douglas-Peucker simplification of a closed polygon
+# Input: (n, 2) corner array of the polygon, the largest allowed distance between the polygon and its simplification
+# Output: The indices of the corners that are kept, and the largest distance of a removed corner to the simplification
+def simplify(border: np.ndarray, tolerance):
+    # The polygon is treated as a line from the first corner around and back to it
+    line = np.vstack([border, border[:1]])
+    keep = np.zeros(len(line), dtype=bool)
+    keep[0] = keep[-1] = True
+    deviation = 0.0
+    stack = [(0, len(line) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        distances = segment_distances(line[first + 1:last], line[first], line[last])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            keep[first + 1 + farthest] = True
+            stack.append((first, first + 1 + farthest))
+            stack.append((first + 1 + farthest, last))
+        else:
+            deviation = max(deviation, float(distances[farthest]))
+    return np.flatnonzero(keep[:-1]), deviation
+
+
+# Distances of an (m, 2) array of points to the segment from start to end
+def segment_distances(points: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    edge = end - start
+    relative = points - start
+    length_sq = float(edge @ edge)
+    if length_sq == 0:
+        return np.hypot(relative[:, 0], relative[:, 1])
+    t = np.clip(relative @ edge / length_sq, 0, 1)
+    distance = relative - t[:, np.newaxis] * edge
+    return np.hypot(distance[:, 0], distance[:, 1])
+
+
+# A polygon together with a simplification of it, and a band around the simplified border containing the polygon border
+# Points outside the band are inside the simplified polygon exactly when they are inside the polygon, as the border can be
+# moved onto the simplified border without ever crossing them. Only points inside the band need the full polygon
+class SimplifiedBorder:
+    def __init__(self, border: np.ndarray, edges: 'EdgeTable' = None, tolerance=SIMPLIFY_TOLERANCE):
+        self.exact = edges if edges is not None else EdgeTable(border)
+        kept, deviation = simplify(border, tolerance)
+        self.edges = EdgeTable(border[kept])
+        # The border points lie within the deviation of the simplified border, the points on the border within the
+        # tolerance of the border
+        self.band = deviation + ON_EDGE_TOLERANCE
+
+    def __len__(self):
+        return len(self.edges)
+
+
+# Converts a list of points to an (n, 2) array of coordinates
+def point_array(points) -> np.ndarray:
+    return np.array([(point.x, point.y) for point in points], dtype=float).reshape(-1, 2)
+
+
+# The border of a region as the cubic Bezier curves of its cycle, for winding numbers without an approximated border
+# Every curve is split into pieces that are monotone in y, so a piece crosses the ray of a point at most once, and the
+# crossing is only solved for when the x-range of the curve does not decide it
+class BezierBorder:
+    def __init__(self, cycle):
+        curves = []
+        signs = []
+        # The paths of a cycle are not all stored in the direction of the cycle, reversed paths count the other way
+        point = cycle[0].start_point
+        if len(cycle) > 1 and cycle[0].end_point is not cycle[1].start_point and \
+                cycle[0].end_point is not cycle[1].end_point:
+            point = cycle[0].end_point
+        for path in cycle:
+            forward = path.start_point is point
+            point = path.end_point if forward else path.start_point
+            for bezier in path.beziers:
+                curves.append([(control.x, control.y) for control in bezier.points])
+                signs.append(1 if forward else -1)
+
+        control = np.array(curves, dtype=float).reshape(-1, 4, 2)
+        # Power basis coefficients a t^3 + b t^2 + c t + d of every curve
+        self.coefficients = np.stack([-control[:, 0] + 3 * control[:, 1] - 3 * control[:, 2] + control[:, 3],
+                                      3 * control[:, 0] - 6 * control[:, 1] + 3 * control[:, 2],
+                                      -3 * control[:, 0] + 3 * control[:, 1],
+                                      control[:, 0]], axis=1)
+        # The curves lie within the bounding box of their control points
+        self.x_min = control[:, :, 0].min(axis=1)
+        self.x_max = control[:, :, 0].max(axis=1)
+
+        pieces = []
+        for curve, (a, b, c, d) in enumerate(self.coefficients[:, :, 1].tolist()):
+            # The pieces end where y turns, at the roots of the derivative 3a t^2 + 2b t + c
+            turns = [t for t in np.roots([3 * a, 2 * b, c]) if np.isreal(t) and 0 < t.real < 1] if (a or b) else []
+            bounds = [0.0] + sorted(float(t.real) for t in turns) + [1.0]
+            for t_start, t_end in zip(bounds, bounds[1:]):
+                y_start = cubic((a, b, c, d), t_start)
+                y_end = cubic((a, b, c, d), t_end)
+                pieces.append((curve, t_start, t_end, y_start, y_end))
+        pieces = np.array(pieces, dtype=float).reshape(-1, 5)
+        self.y_min = np.minimum(pieces[:, 3], pieces[:, 4])
+        self.y_max = np.maximum(pieces[:, 3], pieces[:, 4])
+        # Upward pieces (decreasing y on the screen) count 1, downward pieces -1, as for the edges of a polygon
+        curve_signs = np.array(signs, dtype=int)[pieces[:, 0].astype(int)]
+        direction = np.where(pieces[:, 4] < pieces[:, 3], 1, -1) * curve_signs
+
+        # The same values per piece as plain floats, for the few pieces near a point
+        self.rows = [(int(curve), t_start, t_end, y_start, y_end, x_min, x_max, int(sign))
+                     for (curve, t_start, t_end, y_start, y_end), x_min, x_max, sign in
+                     zip(pieces.tolist(), self.x_min[pieces[:, 0].astype(int)].tolist(),
+                         self.x_max[pieces[:, 0].astype(int)].tolist(), direction.tolist())]
+        self.curve_coefficients = [(tuple(x), tuple(y)) for x, y in
+                                   zip(self.coefficients[:, :, 0].tolist(), self.coefficients[:, :, 1].tolist())]
+
+    def __len__(self):
+        return len(self.coefficients)
+
+    # Finds the parameter where a piece, monotone in y, has the given y
+    # Newton steps are used while they stay inside the interval known to contain the crossing, bisection otherwise
+    @staticmethod
+    def solve(y_coefficients, t_start, t_end, y_start, y_end, y):
+        a, b, c, d = y_coefficients
+        low, high = (t_start, t_end) if y_start < y_end else (t_end, t_start)
+        t = t_start + (t_end - t_start) * (y - y_start) / (y_end - y_start)
+        for _ in range(SOLVE_STEPS):
+            error = ((a * t + b) * t + c) * t + d - y
+            if abs(error) <= SOLVE_TOLERANCE:
+                break
+            if error < 0:
+                low = t
+            else:
+                high = t
+            slope = (3 * a * t + 2 * b) * t + c
+            newton = t - error / slope if slope else None
+            if newton is None or not (min(low, high) < newton < max(low, high)):
+                newton = (low + high) / 2
+            t = newton
+        return t
+
+    # Determines if a point is inside the cycle or on it
+    # Input: The point
+    # Output: Boolean value
+    def contains(self, point) -> bool:
+        x, y = point.x, point.y
+        winding = 0
+        # Pieces ending at the y of the point are included, so points on the border are found at the ends of pieces too
+        for piece in np.flatnonzero((self.y_min <= y) & (y <= self.y_max)).tolist():
+            curve, t_start, t_end, y_start, y_end, x_min, x_max, direction = self.rows[piece]
+            if x_max < x - ON_EDGE_TOLERANCE:
+                continue
+            crosses = min(y_start, y_end) <= y < max(y_start, y_end)
+            if x_min > x + ON_EDGE_TOLERANCE:
+                if crosses:
+                    winding += direction
+                continue
+
+            x_coefficients, y_coefficients = self.curve_coefficients[curve]
+            if y_start == y_end:
+                # A horizontal piece only matters if the point lies on it
+                x_start = cubic(x_coefficients, t_start)
+                x_end = cubic(x_coefficients, t_end)
+                if min(x_start, x_end) <= x <= max(x_start, x_end):
+                    return True
+                continue
+            crossing_x = cubic(x_coefficients, BezierBorder.solve(y_coefficients, t_start, t_end, y_start, y_end, y))
+            if abs(crossing_x - x) <= ON_EDGE_TOLERANCE:
+                return True
+            if crosses and x < crossing_x:
+                winding += direction
+        return winding != 0
+
+
+# Evaluates the polynomial a t^3 + b t^2 + c t + d
+def cubic(coefficients, t):
+    a, b, c, d = coefficients
+    return ((a * t + b) * t + c) * t + d
+
+
+# Winding number algorithm for point in polygon tests, computed for all edges of a polygon at once
+# The polygon is given as an (n, 2) array of its corners, the edge from the last corner to the first closes it
+# Edges follow the half-open rule: an edge crosses the horizontal ray of a point if exactly one of its end points has
+# y <= the y of the point, so a ray through a corner is counted once and horizontal edges are never counted
 class PointInPolygon:
     @staticmethod
-    #Determine if given edge (ImplicitLine) is an upward or downward edge
-    #Input: The edge
-    #Output: 1 (up) or -1 (down)
-    def get_edge_type(edge: ImplicitLine):
-        if edge.start_point.y - edge.end_point.y > 0:
-            return 1  # up
-        else:
-            return -1  # down
+    # Converts a list of points to the corner array of a polygon
+    # Input: List of points
+    # Output: (n, 2) array of coordinates
+    def border_array(points) -> np.ndarray:
+        return point_array(points)
+
+    @staticmethod
+    def edge_table(edges) -> EdgeTable:
+        if isinstance(edges, EdgeTable):
+            return edges
+        return EdgeTable(edges)
 
     @staticmethod
-    #Updates the winding number
-    def update_winding_number(points, winding_number, border_line:ImplicitLine, last_edge_intersected, last_edge_type):
-        edge_type = PointInPolygon.get_edge_type(border_line)
-        # The only way two edges of the same type both can intersect with a point_line
-        # is if they share the intersection point, therefor the 2nd intersection should be skipped
-        if not (last_edge_intersected and last_edge_type == edge_type):
-            # The point is strictly to the left of the upward edge
-            if edge_type == 1 and points[0].x < points[1].x:
-                last_edge_intersected = True
-                winding_number += 1
-            # The point is strictly to the right of the downward edge
-            elif edge_type == -1 and points[0].x < points[1].x:
-                last_edge_intersected = True
-                winding_number -= 1
-        return winding_number, edge_type, last_edge_intersected
+    # Computes the winding numbers of many points in one polygon
+    # Input: The edge table or (n, 2) corner array of the polygon, an (m, 2) array of points, the distance up to which a
+    # point is considered to be on an edge
+    # Output: The winding numbers (m,) and whether each point lies on an edge (m,)
+    def winding_numbers(edges, points: np.ndarray, tolerance=ON_EDGE_TOLERANCE):
+        edges = PointInPolygon.edge_table(edges)
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        x = points[:, 0, np.newaxis]
+        y = points[:, 1, np.newaxis]
 
+        crosses = ~edges.skip & (edges.y_min <= y) & (y < edges.y_max)
+        crossing_x = edges.start_x + (y - edges.start_y) * edges.inverse_slope
+        winding = np.sum(np.where(crosses & (x < crossing_x), edges.direction, 0), axis=1)
+
+        # Points on the border are found by their distance to the edges, as the crossings are rounded
+        relative_x = x - edges.start_x
+        relative_y = y - edges.start_y
+        t = np.clip((relative_x * edges.edge_x + relative_y * edges.edge_y) * edges.inverse_length_sq, 0, 1)
+        distance_x = relative_x - t * edges.edge_x
+        distance_y = relative_y - t * edges.edge_y
+        on_edge = np.any(distance_x * distance_x + distance_y * distance_y <= tolerance * tolerance, axis=1)
+        return winding, on_edge
+
+    @staticmethod
+    # Computes the winding number of a point in a polygon from the edges near the point
+    # Input: The edge table of the polygon, the point, the distance up to which the point is considered to be on an edge
+    # Output: The winding number, or None if the point lies on an edge
+    def winding_number(edges: EdgeTable, point, tolerance=ON_EDGE_TOLERANCE):
+        x, y = point.x, point.y
+        tolerance_sq = tolerance * tolerance
+        winding = 0
+        for index in edges.near(y, tolerance):
+            start_x, start_y, edge_x, edge_y, y_min, y_max, skip, inverse_slope, direction, inverse_length_sq = \
+                edges.rows[index]
+            relative_x = x - start_x
+            relative_y = y - start_y
 
+            # Is the point on the edge?
+            t = min(max((relative_x * edge_x + relative_y * edge_y) * inverse_length_sq, 0), 1)
+            distance_x = relative_x - t * edge_x
+            distance_y = relative_y - t * edge_y
+            if distance_x * distance_x + distance_y * distance_y <= tolerance_sq:
+                return None
+
+            # Does the edge cross the ray to the right of the point?
+            if not skip and y_min <= y < y_max and x < start_x + relative_y * inverse_slope:
+                winding += direction
+        return winding
+
+    @staticmethod
+    # Determines if a point is inside a polygon or on its border
+    # Only the edges whose y-range contains the point can cross its ray or touch it, the rest are not looked at
+    # A simplified border answers from the simplified polygon, unless the point is inside its band
+    # Input: The Bezier border, simplified border, edge table or (n, 2) corner array of the polygon, the point
+    # Output: Boolean value
+    def contains(edges, point) -> bool:
+        if isinstance(edges, BezierBorder):
+            return edges.contains(point)
+        if isinstance(edges, SimplifiedBorder):
+            winding = PointInPolygon.winding_number(edges.edges, point, edges.band)
+            if winding is not None:
+                return winding != 0
+            edges = edges.exact
+        winding = PointInPolygon.winding_number(PointInPolygon.edge_table(edges), point)
+        return winding is None or winding != 0
+
+    @staticmethod
+    # Determines for many points if they are inside a polygon or on its border
+    # Input: The Bezier border, simplified border, edge table or (n, 2) corner array of the polygon, an (m, 2) array of
+    # points
+    # Output: Boolean array (m,)
+    def contains_all(edges, points: np.ndarray) -> np.ndarray:
+        if isinstance(edges, BezierBorder):
+            points = np.asarray(points, dtype=float).reshape(-1, 2)
+            return np.array([edges.contains(Point(x, y)) for x, y in points.tolist()], dtype=bool)
+        if isinstance(edges, SimplifiedBorder):
+            points = np.asarray(points, dtype=float).reshape(-1, 2)
+            winding, in_band = PointInPolygon.winding_numbers(edges.edges, points, edges.band)
+            inside = winding != 0
+            if in_band.any():
+                inside[in_band] = PointInPolygon.contains_all(edges.exact, points[in_band])
+            return inside
+        winding, on_edge = PointInPolygon.winding_numbers(edges, points)
+        return on_edge | (winding != 0)
@@ -0,0 +1,30 @@
+import numpy as np
+
+
+### MAIN RESPONSIBILITY: THOMAS AAMAND WITTING S184192 ###
+# The positions, radii and numbers of paths of the game points at one moment, copied into arrays
+# Validating a move only needs these, so it can run on another thread while the game goes on. The snapshot holds no
+# points, and is not changed by later changes to the game
+class PointSnapshot:
+    def __init__(self, points):
+        points = list(points)
+        self.positions = np.array([(point.x, point.y) for point in points], dtype=float).reshape(-1, 2)
+        self.radii = np.array([point.radius for point in points], dtype=float)
+        # Index of a point -> its number of paths
+        self.degrees = {point.index: point.num_paths for point in points if hasattr(point, 'index')}
+
+    def __len__(self):
+        return len(self.radii)
+
+    # Returns the number of paths a game point had when the snapshot was taken
+    def degree(self, point) -> int:
+        return self.degrees[point.index]
+
+    # Returns the positions and radii of the points whose circle overlaps the given box
+    def circles_in_box(self, min_x, min_y, max_x, max_y):
+        x = self.positions[:, 0]
+        y = self.positions[:, 1]
+        overlaps = (x + self.radii >= min_x) & (x - self.radii <= max_x) & \
+                   (y + self.radii >= min_y) & (y - self.radii <= max_y)
+        slots = np.flatnonzero(overlaps)
+        return self.positions[slots], self.radii[slots]
@@ -1,14 +1,22 @@
 from typing import Dict, Set
 
+import numpy as np
 import pygame
 
 import src.config.game_config as gc
+import src.model.move_stats as move_stats
 from src.model.bezier_intersection import *
 from src.model.bounding_box import *
 from src.model.face_finder import find_faces
+from src.model.lru_memo import LRUMemo
 from src.model.path import Path
 from src.model.point import GraphicsPoint
-from src.model.point_in_polygon import PointInPolygon
+from src.model.point_in_polygon import BezierBorder, EdgeTable, PointInPolygon, SimplifiedBorder, point_array
+from src.model.region_index import RegionIndex
+from src.model.snapshot import copy_on_write, copy_entry_on_write
+
+# Containment results of (region id, region version, point) queries, shared by all regions
+containment_memo = LRUMemo()
 
 
 ### MAIN RESPONSIBILITY: BJÖRN WILTING S184214 ###
@@ -27,6 +35,8 @@ def is_in_range(value, min, max):
 
 # The Region class is used to create, store and maintain the game state of a Sprouts game
 class Region:
+    __lastId = 0
+    __lastVersion = 0
 
     @staticmethod
     # Returns whether a region can be added without exeeding the limit of the points state
@@ -46,10 +56,12 @@ class Region:
 
     @staticmethod
     # Updates the number of line end points in all the regions the given points are contained in
-    # Input: A set of game points
+    # and in the given regions, whose game points changed
+    # Only these regions are recounted, the open connections of all other regions are unchanged by a move
+    # Input: A set of game points, a set of regions
     # Output: None 
-    def update_all_connections(points: Set[GraphicsPoint]):
-        regions = set()
+    def update_all_connections(points: Set[GraphicsPoint], regions=()):
+        regions = set(regions)
         for point in points:
             regions = regions.union(point.regions)
         for region in regions:
@@ -74,7 +86,12 @@ class Region:
         if len(game_point.regions) > 0:
             game_point.regions.discard(region)
         if game_point in region.game_points:
+            copy_on_write(region)
+            copy_entry_on_write(region.game_points, game_point)
             region.game_points.discard(game_point)
+            region.open_connections -= 3 - game_point.num_paths
+            region.count_points({game_point: 1}, -1)
+            region.changed()
 
     ################################################
     # Non-Static Methods                           #
@@ -83,6 +100,9 @@ class Region:
     # The constructor
     def __init__(self, game_points: Set[GraphicsPoint], border_points: List[Point], edge_map: Dict[int, Set[Path]],
                  exclusions: Set['Region'], parent: 'Region' = None, surf=None, cycle: List[Path] = []):
+        self.id = Region.__lastId                # Unique id of the region, never reused
+        Region.__lastId += 1
+        self.version = 0                        # Changes whenever the game points or exclusions of the region change
         self.surf = surf                        # Pygame surface used by draw functions
         self.game_points = game_points          # The visible points used in a game of Sprouts
         # Working with base region
@@ -91,27 +111,100 @@ class Region:
                 point.regions.add(self)
         self.border_points = Region.optimized_border_points(border_points) # A list of points forming the approximate border of the region
         self.cycle = cycle                                                 # A list of Paths forming the cycle that defines the region
+        self.cycle_signature = frozenset(cycle)                            # The paths of the cycle, equal for equal cycles
+        self.cycles = {exclusion.cycle_signature: exclusion for exclusion in exclusions}  # Cycle signature -> region, of the region and its exclusions
+        self.cycles[self.cycle_signature] = self
+        self.subtree_points = dict.fromkeys(game_points, 1)                 # Game point -> number of regions of the subtree containing it
+        for exclusion in exclusions:
+            self.add_counts(exclusion.subtree_points, 1)
         self.bounding_box = get_bounding_box(self.border_points)           # The minimum bounding box of the regions approximation
+        self.border_array = PointInPolygon.border_array(self.border_points)  # The border as an (n, 2) array
+        self.edges = EdgeTable(self.border_array)                          # The border edges prepared for the winding number
+        # The border used by PIP tests, the curves of the cycle in the exact mode, otherwise the simplified border
+        if gc.EXACT_REGION_BORDERS and cycle:
+            self.pip_border = BezierBorder(cycle)
+        else:
+            self.pip_border = SimplifiedBorder(self.border_array, self.edges)
         self.edge_map = edge_map                                           # An adjancency map of all Paths in region, mapping Point-Index -> Set(Path)
         self.exclusions = exclusions                                       # A set of exclusions
         self.parent = parent                                               # The regions parent (the region it is excluded in)
-        self.open_connections = self.compute_connections()                 # The amount of line end points that can be added inside the region
+
+        # All regions of a tree share the point location index of its root
+        if parent:
+            self.index = parent.index
+        else:
+            self.index = RegionIndex(self)
+            for exclusion in exclusions:
+                for region in exclusion.subtree():
+                    region.index = self.index
+                    self.index.insert(region)
+                    self.index.connections_changed(region)
+        self.index.insert(self)
+        self._open_connections = self.compute_connections()                # The amount of line end points that can be added inside the region
+        self.index.connections_changed(self)
+
+    # The amount of line end points that can be added inside the region
+    # Setting it keeps the set of open regions in the index of the region tree up to date
+    @property
+    def open_connections(self):
+        return self._open_connections
+
+    @open_connections.setter
+    def open_connections(self, value):
+        copy_on_write(self)
+        self._open_connections = value
+        self.index.connections_changed(self)
+
+    # The state changed by moves, copied by snapshots of the region tree
+    # The game points and the edge map are not copied, their changed entries are copied by copy_entry_on_write
+    def save_state(self):
+        return self.game_points, self.edge_map, self.exclusions, self.parent, self._open_connections, self.version
+
+    def restore_state(self, state):
+        self.game_points, self.edge_map, self.exclusions, self.parent, self._open_connections, self.version = state
+
+    # Must be called when the game points or exclusions of given region change
+    # Whether a point is in a region depends on the regions below it, so the parents get a new version as well
+    # Versions are never reused, as a restored snapshot brings back older versions
+    # Input: Region instance
+    # Output: None, the region and its parents have a new version
+    def changed(self):
+        region = self
+        while region:
+            copy_on_write(region)
+            Region.__lastVersion += 1
+            region.version = Region.__lastVersion
+            region = region.parent
 
     # Adds point to region and adds region reference to the point
+    # The open connections of the region are kept up to date, so the index knows whether the region is open
     # Input: Point and region
     # Output: None, the point and the region were updated
     def add_point(self, new_point):
-        self.game_points.add(new_point)
+        copy_on_write(self)
+        if new_point not in self.game_points:
+            copy_entry_on_write(self.game_points, new_point)
+            self.game_points.add(new_point)
+            self.open_connections += 3 - new_point.num_paths
+            self.count_points({new_point: 1}, 1)
         new_point.regions.add(self)
+        self.changed()
 
     # Removes the point from given region, and removes the region reference from the point
     # Input: Point and region
     # Output: None, the point and the region were updated
     def remove_point(self, point):
+        copy_on_write(self)
         if point in self.game_points:
+            copy_entry_on_write(self.game_points, point)
             self.game_points.remove(point)
+            self.open_connections -= 3 - point.num_paths
+            self.count_points({point: 1}, -1)
+            self.changed()
         point.regions.discard(self)
-        self.edge_map.pop(point, None)
+        if point in self.edge_map:
+            copy_entry_on_write(self.edge_map, point)
+            self.edge_map.pop(point)
 
     # Generate an adjancency map for given region from a list of paths
     # Input: List of Paths, Region instance
@@ -142,12 +235,15 @@ class Region:
     #Input: Region instance
     #Output: The given region is cleared
     def clear(self):
+        copy_on_write(self)
         points = self.game_points
         self.game_points = {}
+        self.count_points(dict.fromkeys(points, 1), -1)
         for point in points:
             self.remove_point(point)
         self.edge_map = {}
         self.open_connections = 0
+        self.changed()
 
     # Get the game points that are part of the border of the given region
     #Input: Region instance
@@ -170,30 +266,83 @@ class Region:
     # Output: A list of all new and unique cycles
     def detect_cycles(self, p: GraphicsPoint):
         cycles = find_faces(p, self.edge_map)
-        existing_cycles = [self.cycle]
-        for exclusion in self.exclusions:
-            existing_cycles.append(exclusion.cycle)
+        existing_cycles = self.cycle_index()
         new_cycles = []
         for cycle in cycles:
-            new_cycle = True
             if not cycle:
                 continue
-            for existing_cycle in existing_cycles:
-                if not set(cycle).symmetric_difference(set(existing_cycle)):
-                    new_cycle = False
-            if new_cycle:
+            if frozenset(cycle) not in existing_cycles:
                 new_cycles.append(cycle)
         return new_cycles
 
-    # Recursively searches for a region that still is able to add another path
+    # Maps the cycle signatures of given region and its exclusions to their regions
+    # The map is kept up to date by add_exclusions and remove_exclusions
+    # Input: A region instance
+    # Output: Dictionary from cycle signature to region, which must not be modified
+    def cycle_index(self):
+        return self.cycles
+
+    # Adds regions to the exclusions of given region
+    # The set of exclusions is replaced rather than changed, so snapshots can share it
+    # Input: A region instance, a set of regions
+    # Output: None, the exclusions, the cycle index and the subtree points of the region and its parents were updated
+    def add_exclusions(self, regions):
+        self.attach(regions)
+        for region in regions:
+            self.count_points(region.subtree_points, 1)
+
+    # Removes regions from the exclusions of given region
+    # Input: A region instance, a set of regions
+    # Output: None, the exclusions, the cycle index and the subtree points of the region and its parents were updated
+    def remove_exclusions(self, regions):
+        self.detach(regions)
+        for region in regions:
+            self.count_points(region.subtree_points, -1)
+
+    # Moves exclusions of given region to another of its exclusions
+    # The subtree of given region keeps the same points, so only the subtree points of the new parent change
+    # Input: A region instance, a set of regions, the exclusion they are moved to
+    # Output: None, the exclusions, the cycle indexes and the subtree points of the new parent were updated
+    def move_exclusions(self, regions, new_parent: 'Region'):
+        self.detach(regions)
+        new_parent.attach(regions)
+        for region in regions:
+            new_parent.add_counts(region.subtree_points, 1)
+
+    def attach(self, regions):
+        copy_on_write(self)
+        self.exclusions = self.exclusions.union(regions)
+        for region in regions:
+            if region.cycle_signature != self.cycle_signature:
+                copy_entry_on_write(self.cycles, region.cycle_signature)
+                self.cycles[region.cycle_signature] = region
+
+    def detach(self, regions):
+        copy_on_write(self)
+        self.exclusions = self.exclusions.difference(regions)
+        for region in regions:
+            if self.cycles.get(region.cycle_signature) is region:
+                copy_entry_on_write(self.cycles, region.cycle_signature)
+                self.cycles.pop(region.cycle_signature)
+
+    # Returns a region that still is able to add another path
+    # The root of a region tree looks it up in the open regions of the index, other regions search their subtree
     #Input: Starting region (root node)
-    #Output: The first encountered open region or None
+    #Output: An open region or None
     def find_open_region(self):
+        if self.index.root is self:
+            return self.index.open_region()
+        return self.search_open_region()
+
+    # Recursively searches for a region that still is able to add another path
+    #Input: Starting region
+    #Output: The first encountered open region or None
+    def search_open_region(self):
         if self.compute_connections() > 1:
             return self
         else:
             for exclusion in self.exclusions:
-                open = exclusion.find_open_region()
+                open = exclusion.search_open_region()
                 if open:
                     return open
             return None
@@ -234,39 +383,75 @@ class Region:
                         self.remove_from_edge_map(path)
 
     # Add a single path to a regions adjancency map
+    # The sets of paths are replaced rather than changed, so snapshots can share them
     #Input: A region, the new path
     #Output: None, the path was added to the regions edge map
     def update_edge_map(self, new_path):
+        copy_on_write(self)
         for point in [new_path.start_point.index, new_path.end_point.index]:
-            if point in self.edge_map:
-                path_set = self.edge_map[point]
-                path_set.add(new_path)
-            else:
-                path_set = set([new_path])
-            self.edge_map.update({point: path_set})
+            copy_entry_on_write(self.edge_map, point)
+            self.edge_map[point] = self.edge_map.get(point, set()) | {new_path}
 
     # remove a path from given regions adjacency map
     #Input: A region instance, the path to be removed
     #Output: None, the path is removed from the regions edge map
     def remove_from_edge_map(self, path):
+        copy_on_write(self)
         for point in [path.start_point.index, path.end_point.index]:
-            if point in self.edge_map:
-                path_set = self.edge_map[point]
-                if path_set and path in path_set:
-                    path_set.remove(path)
-                    if path_set:
-                        self.edge_map.update({point: path_set})
-                    else:
-                        self.edge_map.pop(point, None)
+            path_set = self.edge_map.get(point)
+            if path_set and path in path_set:
+                copy_entry_on_write(self.edge_map, point)
+                path_set = path_set - {path}
+                if path_set:
+                    self.edge_map[point] = path_set
+                else:
+                    self.edge_map.pop(point)
+
+    # Iterates all regions in the subtree of given region, including the region itself
+    def subtree(self):
+        yield self
+        for exclusion in self.exclusions:
+            yield from exclusion.subtree()
+
+    # The number of regions above given region in the region tree
+    def depth(self):
+        depth = 0
+        parent = self.parent
+        while parent:
+            depth += 1
+            parent = parent.parent
+        return depth
 
     # Retrieves all game points in subtree of given region
+    # The points are counted as they are added to and removed from the regions of the subtree, so nothing is collected
     # Input: A region, root node
-    # Output: A set of game points
+    # Output: A view of the game points, which changes with the subtree
     def points_in_subtree(self):
-        points = set(self.game_points)
-        for exclusion in self.exclusions:
-            points = points.union(exclusion.points_in_subtree())
-        return points
+        return self.subtree_points.keys()
+
+    # Adds counts of game points to the subtree points of given region and the regions above it
+    # A region which is not yet an exclusion of its parent, e.g. a new region, only counts its own subtree
+    # Input: A region instance, a dictionary from game point to count, 1 to add the counts or -1 to remove them
+    # Output: None, the subtree points were updated
+    def count_points(self, counts, sign):
+        region = self
+        while region:
+            region.add_counts(counts, sign)
+            if region.parent and region in region.parent.exclusions:
+                region = region.parent
+            else:
+                region = None
+
+    # Adds counts of game points to the subtree points of given region only
+    # Points are removed when their count reaches zero. The entries are recorded, so snapshots can restore them
+    def add_counts(self, counts, sign):
+        for point, count in counts.items():
+            copy_entry_on_write(self.subtree_points, point)
+            count = self.subtree_points.get(point, 0) + sign * count
+            if count:
+                self.subtree_points[point] = count
+            else:
+                self.subtree_points.pop(point, None)
 
     # Determines whether a given region was split by the newly created cycle
     #Input: A region, the cycle that might split the region, the starting point for iterating the cycle
@@ -303,7 +488,13 @@ class Region:
         for point in points:
             if self.is_point_in_region(point) and not (point in self.game_points):
                 missing_game_points.add(point)
-        self.game_points = self.game_points.union(missing_game_points)
+        move_stats.count("points_transferred", len(missing_game_points))
+        if missing_game_points:
+            copy_on_write(self)
+            self.game_points = self.game_points.union(missing_game_points)
+            self.open_connections += sum(3 - point.num_paths for point in missing_game_points)
+            self.count_points(dict.fromkeys(missing_game_points, 1), 1)
+            self.changed()
 
         paths_to_remove = set()
         for point in missing_game_points:
@@ -329,6 +520,7 @@ class Region:
         new_region_splitted = False
         clear_region = False
         for exclusion in self.exclusions:
+            move_stats.count("exclusions_scanned")
             all_points_in_region = True # All game point of current exclusion are located within the new region
             all_on_border = True # All of the current exclusion's game point are located on the border of the new region
             border_set = new_region.get_outer_set() # All game points on the border of the new region
@@ -340,11 +532,13 @@ class Region:
             else:
                 points_inside_exclusion = exclusion.get_outer_set()
 
-            #Iterate the current exclusion's game points
-            for game_point in points_inside_exclusion:
+            #Iterate the current exclusion's game points, testing whether they are inside the new region all at once
+            points_inside_exclusion = list(points_inside_exclusion)
+            in_polygon = new_region.is_points_in_polygon(point_array(points_inside_exclusion)).tolist()
+            for game_point, in_new_region in zip(points_inside_exclusion, in_polygon):
                 if game_point in border_set: # Is the point part of the new regions border?
                     on_border += 1
-                if not (new_region.is_point_in_polygon(game_point) or game_point in new_region.game_points): #Is the point inside the new region?
+                if not (in_new_region or game_point in new_region.game_points): #Is the point inside the new region?
                     all_points_in_region = False
                     break
 
@@ -373,15 +567,15 @@ class Region:
                     rotation_regions.add(exclusion)
 
         # Update the parent regions exclusions
-        parent_regions = self.exclusions.difference(rotation_regions)
-        parent_regions.add(new_region)
-        self.exclusions = parent_regions
+        self.add_exclusions({new_region})
 
-        #Add exclusions to the new region
-        new_region.exclusions = rotation_regions
+        #Move the exclusions to the new region
+        self.move_exclusions(rotation_regions, new_region)
         #Update the parent of the new region's exclusions
         for region in rotation_regions:
+            copy_on_write(region)
             region.parent = new_region
+        new_region.changed()
         #Update the new region's edge map and the parent region's (self)
         new_region.add_edges(rotation_regions)
         self.remove_edges(rotation_regions)
@@ -399,6 +593,8 @@ class Region:
         if len(paths) > 2 or not paths: #Validates the given path list input
             #Should never be reached, unless the game already broke earlier
             raise Exception("the list of paths was empty or longer than 2 elements")
+        # Times and counts the phases of the move, if the instrumentation is on
+        move_stats.begin_move()
         #Update the current region (self)
         self.update(paths, mid_point)
         start_path, end_path = paths[0], paths[1]
@@ -406,24 +602,31 @@ class Region:
         start_point = start_path.get_other_point(mid_point)
         end_point = end_path.get_other_point(mid_point)
         # Check to see if any cycles are made
-        cycles = self.detect_cycles(mid_point)
+        with move_stats.phase("detect_cycles"):
+            cycles = self.detect_cycles(mid_point)
+        move_stats.count("cycles", len(cycles))
 
         last_cycle_split, container_region, split_region = False, None, False
         child_regions = set()
         # Set of points that will change the amount of open connections for some regions
         points_connections_update = set([start_point, mid_point, end_point])
+        # Set of regions that gain or lose game points
+        regions_connections_update = set([self])
 
         if cycles: #If cycles were found
             for cycle in cycles:
                 if last_cycle_split and container_region:
                     #The current cycle is cycle defines a region, which is a child of the most recent added region of the tree
-                    child_region = container_region.create_region_from_cycle(cycle)
-                    last_cycle_split = container_region.insert_rotation(child_region)
+                    insert_region = container_region
                 else:
                     # The new region is a normal addition to the tree
-                    child_region = self.create_region_from_cycle(cycle)
-                    last_cycle_split = self.insert_rotation(child_region)
+                    insert_region = self
+                with move_stats.phase("create_regions"):
+                    child_region = insert_region.create_region_from_cycle(cycle)
+                with move_stats.phase("insert_rotation"):
+                    last_cycle_split = insert_region.insert_rotation(child_region)
                 child_region.compute_edge_map(cycle)
+                regions_connections_update.add(child_region)
 
                 if last_cycle_split and not container_region:
                     # Cycle has been split and is an empty container
@@ -432,45 +635,56 @@ class Region:
                 else:
                     child_regions.add(child_region)
 
-            if not container_region and len(cycles) == 2:
-                # The region that was inserted into, was split and has to be updated
-                for child_region in child_regions:
-                    parent_region = child_region.parent
-                    while not parent_region.game_points:
-                        parent_region = parent_region.parent
-
-                    child_region.transfer_game_points(parent_region)
-
-                self.clear()
-            elif split_region:
-                container_region.clear()
-
-                # For all outer points in exclusions, if they are not outer points in the container region, they
-                # can't be visible for other regions
-
-                # Compute points to move further down in the subtree
-                points_to_move = container_region.points_in_subtree().difference(container_region.get_outer_set())
-                proper_parent = container_region.find_proper_parent()
-                #Transfer points to child, from non-empty parent
-                for point in points_to_move:
-                    proper_parent.remove_point(point)
-
-                for child_region in child_regions:
-                    # Find non-empty parent for current child
-                    parent_region = child_region.parent
-                    while not parent_region.game_points:
-                        parent_region = parent_region.parent
-
-                    #Transfer game points to child regions
-                    child_region.transfer_game_points(parent_region)
-
-                #Add points that changed state
-                points_connections_update = points_connections_update.union(points_to_move)
-            else:
-                #Transfer game point from actual parent to child
-                child_region.transfer_game_points(child_region.find_proper_parent())
+            with move_stats.phase("transfer_points"):
+                if not container_region and len(cycles) == 2:
+                    # The region that was inserted into, was split and has to be updated
+                    for child_region in child_regions:
+                        parent_region = child_region.parent
+                        while not parent_region.game_points:
+                            parent_region = parent_region.parent
+
+                        child_region.transfer_game_points(parent_region)
+                        regions_connections_update.add(parent_region)
+
+                    self.clear()
+                elif split_region:
+                    container_region.clear()
+
+                    # For all outer points in exclusions, if they are not outer points in the container region, they
+                    # can't be visible for other regions
+
+                    # Compute points to move further down in the subtree
+                    points_to_move = container_region.points_in_subtree() - container_region.get_outer_set()
+                    move_stats.count("points_transferred", len(points_to_move))
+                    proper_parent = container_region.find_proper_parent()
+                    regions_connections_update.add(proper_parent)
+                    #Transfer points to child, from non-empty parent
+                    for point in points_to_move:
+                        proper_parent.remove_point(point)
+
+                    for child_region in child_regions:
+                        # Find non-empty parent for current child
+                        parent_region = child_region.parent
+                        while not parent_region.game_points:
+                            parent_region = parent_region.parent
+
+                        #Transfer game points to child regions
+                        child_region.transfer_game_points(parent_region)
+                        regions_connections_update.add(parent_region)
+
+                    #Add points that changed state
+                    points_connections_update = points_connections_update.union(points_to_move)
+                else:
+                    #Transfer game point from actual parent to child
+                    proper_parent = child_region.find_proper_parent()
+                    child_region.transfer_game_points(proper_parent)
+                    regions_connections_update.add(proper_parent)
         #Update all affected regions open connections
-        Region.update_all_connections(points_connections_update)
+        with move_stats.phase("update_connections"):
+            Region.update_all_connections(points_connections_update, regions_connections_update)
+        # Regions may have moved to another depth of the tree
+        self.index.tree_changed()
+        move_stats.end_move(lambda: max(region.depth() for region in self.index.root.subtree()))
 
     # Create a new region instance from given cycle
     #Input: Current region, a cycle to create a new exclusions
@@ -521,7 +735,7 @@ class Region:
         pygame.draw.polygon(SCREEN, gc.REGION_COLOR, border_points, 5)
 
         for p in self.game_points:
-            p.draw(SCREEN)
+            pygame.draw.circle(SCREEN, p.color, p.pos(), p.radius)
         for region in self.exclusions:
             region.draw(SCREEN)
 
@@ -532,108 +746,123 @@ class Region:
     #Input: a region and a point
     #Output: Boolean Value that states whether the point is contained in given region or not
     def is_point_in_polygon(self, point: Point):
-        points = [point, None]
-        if is_inside_box(point, self.bounding_box):
-            # Point is inside current bounding box
-            # Compute winding number inorder to determine if point is in current polygon
-            last_edge_type = None
-            last_edge_intersected = False
-            winding_number = 0
-            point_line = ImplicitLine(point, Point(self.bounding_box[1].x, point.y))
-            for i in range(-1, len(self.border_points) - 1):
-                if self.border_points[i].x == self.border_points[i + 1].x and \
-                        self.border_points[i].y == self.border_points[i + 1].y:
-                    continue
-                border_line = ImplicitLine(self.border_points[i], self.border_points[i + 1])
-                points[1] = border_line.intersection(point_line)
-                # If there is an intersection, the winding number changes
-                min_x, max_x = get_min_max_x(self.border_points[i], self.border_points[i+1])
-                if type(points[1]) == Point and is_in_range(points[1].x, min_x, max_x):
-                    if (point.equals(points[1])):
-                        return True
-                    winding_number, last_edge_type, last_edge_intersected = \
-                        PointInPolygon.update_winding_number(points, winding_number, border_line, \
-                                                             last_edge_intersected, last_edge_type)
-            if abs(winding_number) > 0:
-                return True
-        return False
+        if not is_inside_box(point, self.bounding_box):
+            return False
+        key = (self.id, 'polygon', point.x, point.y)
+        inside = containment_memo.get(key)
+        if inside is LRUMemo.MISSING:
+            move_stats.count("pip_calls")
+            inside = PointInPolygon.contains(self.pip_border, point)
+            containment_memo.put(key, inside)
+        return inside
 
     # Return whether given point is inside this region or not
     # Only checks direct exclusions
     #Input: a region and a point
     #Output: Boolean Value that states whether the point is contained in given region or not
+    # The results are memoized for the current version of the region
     def is_point_in_region(self, point: Point, in_child=False):
         # evaluate if point is inside bounding box of this region
-        points = [point, None]
-        if is_inside_box(point, self.bounding_box):
-            if not in_child or not self.game_points:
-                # Evaluate if the given point lies inside any region contained inside current region
-                for exclusion in self.exclusions:
-                    in_subregion = exclusion.is_point_in_region(point, True)
-                    if in_subregion:
-                        return False
-            # Point is inside current bounding box
-            # Compute winding number inorder to determine if point is in current polygon
-            last_edge_type = None
-            last_edge_intersected = False
-            winding_number = 0
-            point_line = ImplicitLine(point, Point(self.bounding_box[1].x, point.y))
-            for i in range(-1, len(self.border_points) - 1):
-                if self.border_points[i].x == self.border_points[i + 1].x and \
-                        self.border_points[i].y == self.border_points[i + 1].y:
-                    continue
-                border_line = ImplicitLine(self.border_points[i], self.border_points[i + 1])
-                points[1] = border_line.intersection(point_line)
-                # If there is an intersection, the winding number changes
-                min_x, max_x = get_min_max_x(self.border_points[i], self.border_points[i+1])
-                if type(points[1]) == Point and is_in_range(points[1].x, min_x, max_x):
-                    if (point.equals(points[1])):
-                        return True
-                    winding_number, last_edge_type, last_edge_intersected = \
-                        PointInPolygon.update_winding_number(points, winding_number, border_line, \
-                                                             last_edge_intersected, last_edge_type)
-            if abs(winding_number) > 0:
-                return True
-        return False
+        if not is_inside_box(point, self.bounding_box):
+            return False
+        key = (self.id, self.version, point.x, point.y, in_child)
+        inside = containment_memo.get(key)
+        if inside is LRUMemo.MISSING:
+            inside = self.compute_point_in_region(point, in_child)
+            containment_memo.put(key, inside)
+        return inside
+
+    # Computes is_point_in_region for a point inside the bounding box of given region
+    def compute_point_in_region(self, point: Point, in_child):
+        if not in_child or not self.game_points:
+            # Evaluate if the given point lies inside any region contained inside current region
+            for exclusion in self.exclusions:
+                in_subregion = exclusion.is_point_in_region(point, True)
+                if in_subregion:
+                    return False
+        return self.is_point_in_polygon(point)
 
     # Returns the region the given point is contained in, or None if the region wasn't found
+    # The root of a region tree uses the point location index, other regions search their subtree
+    #Input: a region and a point
+    #Output: The region that contains the point or None if no such region was found
+    def find_region(self, point: Point):
+        if self.index.root is self:
+            return self.index.find_region(point)
+        return self.search_region(point)
+
+    # Returns the region the given point is contained in by descending the region tree, or None
     # Utilizes the  winding number algorithm for solving PIP problems
     # Is called on the region where the search should start
     #Input: a region and a point
     #Output: The region that contains the point or None if no such region was found
-    def find_region(self, point: Point):
-        points = [point, None]
+    def search_region(self, point: Point):
         # evaluate if point is inside bounding box of this region
         if is_inside_box(point, self.bounding_box):
             # Evaluate if the given point lies inside any region contained inside current region
             for exclusion in self.exclusions:
                 # If so, return that region
-                in_subregion = exclusion.find_region(point)
+                in_subregion = exclusion.search_region(point)
                 if in_subregion:
                     return in_subregion
 
             if not self.game_points:
                 return None
-            # Point is inside current bounding box
-            # Compute winding number inorder to determine if point is in current polygon
-            last_edge_type = None
-            last_edge_intersected = False
-            winding_number = 0
-            point_line = ImplicitLine(point, Point(self.bounding_box[1].x, point.y))
-            for i in range(-1, len(self.border_points) - 1):
-                if self.border_points[i].x == self.border_points[i + 1].x and \
-                        self.border_points[i].y == self.border_points[i + 1].y:
-                    continue
-                border_line = ImplicitLine(self.border_points[i], self.border_points[i + 1])
-                points[1] = border_line.intersection(point_line)
-                # If there is an intersection, the winding number changes
-                min_x, max_x = get_min_max_x(self.border_points[i], self.border_points[i+1])
-                if type(points[1]) == Point and is_in_range(points[1].x, min_x, max_x):
-                    if (points[0].equals(points[1])):
-                        return self
-                    winding_number, last_edge_type, last_edge_intersected = \
-                        PointInPolygon.update_winding_number(points, winding_number, border_line, \
-                                                             last_edge_intersected, last_edge_type)
-            if abs(winding_number) > 0:
+            if self.is_point_in_polygon(point):
                 return self
-        return None
\ No newline at end of file
+        return None
+
+    # Batch version of is_point_in_polygon
+    #Input: a region and an (m, 2) array of points
+    #Output: Boolean array (m,) that states for each point whether it is contained in given region
+    def is_points_in_polygon(self, points: np.ndarray):
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        inside = are_inside_box(points, self.bounding_box)
+        if inside.any():
+            move_stats.count("pip_calls", int(inside.sum()))
+            inside[inside] = PointInPolygon.contains_all(self.pip_border, points[inside])
+        return inside
+
+    # Batch version of is_point_in_region, every region is visited once for all the points
+    #Input: a region and an (m, 2) array of points
+    #Output: Boolean array (m,) that states for each point whether it is contained in given region
+    def is_points_in_region(self, points: np.ndarray, in_child=False):
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        inside = are_inside_box(points, self.bounding_box)
+        if not in_child or not self.game_points:
+            # Points inside any region contained inside current region are not in this region
+            for exclusion in self.exclusions:
+                if not inside.any():
+                    break
+                inside[inside] = ~exclusion.is_points_in_region(points[inside], True)
+        if inside.any():
+            move_stats.count("pip_calls", int(inside.sum()))
+            inside[inside] = PointInPolygon.contains_all(self.pip_border, points[inside])
+        return inside
+
+    # Batch version of search_region, returns the region every point is contained in
+    # The points are passed down the region tree together, so every region is visited at most once
+    #Input: a region and an (m, 2) array of points
+    #Output: A list with the region containing each point, or None if no such region was found
+    def find_regions(self, points: np.ndarray):
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        regions = [None] * len(points)
+        self.search_regions(points, np.arange(len(points)), regions)
+        return regions
+
+    # Assigns the region containing each of the given points, skipping points that already have one
+    #Input: a region, an (m, 2) array of points, the indices of the points to search, the result list
+    #Output: None, the regions of the found points are set in the result list
+    def search_regions(self, points, indices, regions):
+        indices = indices[are_inside_box(points[indices], self.bounding_box)]
+        for exclusion in self.exclusions:
+            if not len(indices):
+                return
+            exclusion.search_regions(points, indices, regions)
+            indices = np.array([i for i in indices.tolist() if regions[i] is None], dtype=int)
+
+        if not self.game_points or not len(indices):
+            return
+        move_stats.count("pip_calls", len(indices))
+        for i in indices[PointInPolygon.contains_all(self.pip_border, points[indices])].tolist():
+            regions[i] = self
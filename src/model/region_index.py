@@ -0,0 +1,82 @@
+import math
+
+from src.model.snapshot import copy_on_write, copy_entry_on_write
+
+CELL_SIZE = 50  # Side length of the square cells of the grid
+
+
+### MAIN RESPONSIBILITY: BJÖRN WILTING S184214 ###
+# Uniform grid over the regions of a region tree, mapping each cell to the regions whose bounding box overlaps it
+# Locating a point only tests the regions of one cell, deepest first, instead of descending the tree
+# The index also keeps the regions which are still open, so the end of a game is found without visiting the tree
+class RegionIndex:
+    def __init__(self, root, cell_size=CELL_SIZE):
+        self.root = root                # The root region of the indexed tree
+        self.cell_size = cell_size
+        self.cells = {}
+        self.sorted_cells = {}          # The regions of a cell sorted deepest first, until the tree changes
+        self.open_regions = set()       # The regions with at least two open connections, a path can still be drawn in
+
+    def cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    # Adds a region to all cells overlapped by its bounding box
+    # Input: The region
+    # Output: None, the region is a candidate for the points in its cells
+    def insert(self, region):
+        copy_on_write(self)
+        min_point, max_point = region.bounding_box
+        min_x, min_y = self.cell(min_point.x, min_point.y)
+        max_x, max_y = self.cell(max_point.x, max_point.y)
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                # The lists are replaced rather than changed, so snapshots can share them
+                copy_entry_on_write(self.cells, (x, y))
+                self.cells[(x, y)] = self.cells.get((x, y), []) + [region]
+        self.sorted_cells = {}
+
+    # Must be called when regions are moved in the tree, as the order of the candidates depends on their depth
+    def tree_changed(self):
+        copy_on_write(self)
+        self.sorted_cells = {}
+
+    # Returns the regions which may contain the given point, deepest first
+    def candidates(self, point):
+        cell = self.cell(point.x, point.y)
+        regions = self.sorted_cells.get(cell)
+        if regions is None:
+            regions = sorted(self.cells.get(cell, []), key=lambda region: region.depth(), reverse=True)
+            self.sorted_cells[cell] = regions
+        return regions
+
+    # Returns the deepest region containing the given point, the same region the descent of Region.find_region finds
+    # Container regions are skipped, the point then belongs to the closest region above them
+    # Input: The point
+    # Output: The region containing the point, or None
+    def find_region(self, point):
+        for region in self.candidates(point):
+            if region.game_points and region.is_point_in_polygon(point):
+                return region
+        return None
+
+    # Must be called when the open connections of a region change
+    def connections_changed(self, region):
+        is_open = region.open_connections > 1
+        if is_open != (region in self.open_regions):
+            copy_entry_on_write(self.open_regions, region)
+            if is_open:
+                self.open_regions.add(region)
+            else:
+                self.open_regions.discard(region)
+
+    # Returns a region a path can still be drawn in, or None if the game is over
+    def open_region(self):
+        return next(iter(self.open_regions), None)
+
+    # The state changed by moves, copied by snapshots of the region tree
+    # The cells and open regions are not copied, their changed entries are copied by copy_entry_on_write
+    def save_state(self):
+        return None
+
+    def restore_state(self, state):
+        self.sorted_cells = {}
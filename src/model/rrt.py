@@ -1,5 +1,6 @@
 import random
 
+import numpy as np
 import pygame
 
 import src.config.game_config as gc
@@ -7,6 +8,9 @@ from src.model.bounding_box import get_bounding_box
 from src.model.path import Path
 from src.model.point import Point, GraphicsPoint
 
+NEAREST_NODES = 15   # Number of nearest nodes an edge to a new node is tried from
+CANDIDATE_CHUNK = 4  # New nodes classified at once. An early one is usually accepted, so the rest are not classified
+
 
 ### MAIN RESPONSIBILITY: THOMAS AAMAND WITTING S184192 ###
 class RRT:
@@ -76,39 +80,39 @@ class RRT:
             qnew = None
 
             # Create edge between qnew and one of the 15 nearest points (if possible)
-            for i in range(min(len(qnearest), 15)):
-                print(i)
-                qnear = qnearest[i]
-
-                # create new point a distance of self.growth away from qnear, in the direction of the random point
-                qnew = self.new_conf(qnear, qrand)
-
-                # point is outside screen, generate new point
-                if qnew.point.x < 0 or qnew.point.x >= gc.WINDOW_WIDTH or qnew.point.y < 0 or qnew.point.y >= gc.WINDOW_HEIGHT:
-                    continue
-
-
-                shares_region = False
-                for region in shared_regions:
-                    if region.is_point_in_region(qnew.point):
-                        shares_region = True
-                if not shares_region:
-                    continue
-
-                path = self.build_sub_path(qnear, alt_start_node=qnew)
-
-                # shrink the growth factor
-                if not self.valid_sub_path(path):
-                    if fail_counter > 25 and self.growth > 50:
-                        self.growth = self.growth * 3 // 4
-                        fail_counter = 1
-                    elif self.growth > 50:
-
-                        fail_counter += 1
-                    valid = False
-                    continue
-                else:
-                    valid = True
+            qnearest = qnearest[:NEAREST_NODES]
+            for chunk_start in range(0, len(qnearest), CANDIDATE_CHUNK):
+                # create new points a distance of self.growth away from the next few nearest points, in the direction
+                # of the random point, and find the ones inside the screen and a shared region in one go
+                chunk = qnearest[chunk_start:chunk_start + CANDIDATE_CHUNK]
+                qnews = [self.new_conf(qnear, qrand) for qnear in chunk]
+                free = self.free_conf_mask(qnews, shared_regions)
+
+                for i in range(len(chunk)):
+                    print(chunk_start + i)
+                    qnear = chunk[i]
+                    qnew = qnews[i]
+
+                    # point is outside screen or the shared regions, try the next point
+                    if not free[i]:
+                        continue
+
+                    path = self.build_sub_path(qnear, alt_start_node=qnew)
+
+                    # shrink the growth factor
+                    if not self.valid_sub_path(path):
+                        if fail_counter > 25 and self.growth > 50:
+                            self.growth = self.growth * 3 // 4
+                            fail_counter = 1
+                        elif self.growth > 50:
+
+                            fail_counter += 1
+                        valid = False
+                        continue
+                    else:
+                        valid = True
+                        break
+                if valid:
                     break
 
             if not valid or not qnew:
@@ -177,6 +181,18 @@ class RRT:
         temp = temp.normalized()
         return Node(qnear.point + temp.scalar(self.growth))
 
+    # Returns for each node whether it is inside the screen and inside one of the given regions
+    def free_conf_mask(self, nodes, regions):
+        points = np.array([(node.point.x, node.point.y) for node in nodes], dtype=float).reshape(-1, 2)
+        on_screen = (points[:, 0] >= 0) & (points[:, 0] < gc.WINDOW_WIDTH) & \
+                    (points[:, 1] >= 0) & (points[:, 1] < gc.WINDOW_HEIGHT)
+        # Only the points on the screen are looked up in the regions
+        free = np.zeros(len(points), dtype=bool)
+        if on_screen.any():
+            for region in regions:
+                free[on_screen] |= region.is_points_in_region(points[on_screen])
+        return free.tolist()
+
     # returns the nearest node
     def nearest_node(self, node):
         return min(self.nodes, key=lambda x: x.point.distance_sq(node.point))
@@ -0,0 +1,108 @@
+_recording = []  # The snapshots being recorded, the innermost last
+MISSING = object()  # The value of a dictionary entry which did not exist when it was copied
+
+
+### MAIN RESPONSIBILITY: BJÖRN WILTING S184214 ###
+# Copy-on-write snapshot of the region tree: the regions, the index of their tree and the game points in it
+# Used by the region benchmark to try a move and take it back. Main.paths, Main.points, the sprites and the rest of
+# the UI state are not covered, and the game itself has no undo
+# Taking a snapshot copies nothing. An object copies its state into the innermost snapshot the first time it is changed
+# afterwards, so a move only costs copies of the objects it changes. Restoring a snapshot writes the copies back
+# Objects taking part implement save_state() and restore_state(state), and call copy_on_write(self) before every change
+# Large dictionaries and sets are not copied by save_state. Their owners call copy_entry_on_write before changing one
+# of their entries, so only the changed entries are copied
+# Objects created while a snapshot is recorded call created(self), and implement discard() to give back what they took
+class Snapshot:
+    def __init__(self):
+        self.saved = {}    # id of an object -> (object, state before the first change)
+        self.entries = {}  # (id of a dictionary or set, key) -> (dictionary or set, key, entry before the first change)
+        self.created = []  # The objects created since the snapshot was taken, in order of creation
+
+    @staticmethod
+    # Starts recording changes to the region tree
+    # Input: None
+    # Output: The snapshot of the current state
+    def take() -> 'Snapshot':
+        snapshot = Snapshot()
+        _recording.append(snapshot)
+        return snapshot
+
+    def __len__(self):
+        return len(self.saved) + len(self.entries)
+
+    # Copies the state of an object, unless it was copied since the snapshot was taken
+    def save(self, obj):
+        key = id(obj)
+        if key not in self.saved:
+            self.saved[key] = (obj, obj.save_state())
+
+    # Copies the value of a dictionary entry, or whether an item is in a set, unless it was copied since the snapshot
+    # was taken. Values of dictionaries must be replaced rather than changed, so the copy can share them
+    def save_entry(self, container, key):
+        entry = (id(container), key)
+        if entry not in self.entries:
+            if isinstance(container, dict):
+                self.entries[entry] = (container, key, container.get(key, MISSING))
+            else:
+                self.entries[entry] = (container, key, key in container)
+
+    # Returns the region tree to the state of the snapshot and stops recording
+    # Snapshots taken later must be restored or released first
+    def restore(self):
+        self.stop()
+        for obj, state in self.saved.values():
+            obj.restore_state(state)
+        for container, key, before in self.entries.values():
+            if isinstance(container, dict):
+                if before is MISSING:
+                    container.pop(key, None)
+                else:
+                    container[key] = before
+            elif before:
+                container.add(key)
+            else:
+                container.discard(key)
+        # Newest first, so counters are given back in the order they were taken
+        for obj in reversed(self.created):
+            obj.discard()
+        self.saved = {}
+        self.entries = {}
+        self.created = []
+
+    # Keeps the changes made since the snapshot was taken and stops recording
+    # The copies are handed to the enclosing snapshot, which can still restore the state from before them
+    def release(self):
+        self.stop()
+        if _recording:
+            outer = _recording[-1]
+            for key, saved in self.saved.items():
+                outer.saved.setdefault(key, saved)
+            for key, entry in self.entries.items():
+                outer.entries.setdefault(key, entry)
+            outer.created.extend(self.created)
+        self.saved = {}
+        self.entries = {}
+        self.created = []
+
+    def stop(self):
+        if not _recording or _recording[-1] is not self:
+            raise Exception("only the innermost snapshot can be restored or released")
+        _recording.pop()
+
+
+# Must be called by an object of the region tree before it is changed
+def copy_on_write(obj):
+    if _recording:
+        _recording[-1].save(obj)
+
+
+# Must be called before an entry of a dictionary or set of the region tree is changed in place
+def copy_entry_on_write(container, key):
+    if _recording:
+        _recording[-1].save_entry(container, key)
+
+
+# Must be called by an object of the region tree when it is created
+def created(obj):
+    if _recording:
+        _recording[-1].created.append(obj)
@@ -0,0 +1,61 @@
+import math
+
+CELL_SIZE = 32  # Larger than the diameter of a game point, so a point covers at most four cells
+
+
+### MAIN RESPONSIBILITY: THOMAS AAMAND WITTING S184192 ###
+# Grid of square cells mapping each cell to the available game points whose circle overlaps it. Finding the point
+# under the cursor only looks at the points in one cell
+class SpatialHash:
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.point_cells = {}
+
+    def __len__(self):
+        return len(self.point_cells)
+
+    def __contains__(self, point):
+        return point in self.point_cells
+
+    def cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    # Returns the cells overlapped by the bounding box of the circle of a point
+    def covered_cells(self, point):
+        min_x, min_y = self.cell(point.x - point.radius, point.y - point.radius)
+        max_x, max_y = self.cell(point.x + point.radius, point.y + point.radius)
+        return [(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+
+    # Adds a point, or moves it to the cells of its current position if it is already added
+    def insert(self, point):
+        self.remove(point)
+        cells = self.covered_cells(point)
+        for cell in cells:
+            self.cells.setdefault(cell, []).append(point)
+        self.point_cells[point] = cells
+
+    def remove(self, point):
+        cells = self.point_cells.pop(point, None)
+        if cells is None:
+            return
+        for cell in cells:
+            points = self.cells[cell]
+            points.remove(point)
+            if not points:
+                del self.cells[cell]
+
+    # Adds the point if it can get another path, and removes it otherwise
+    def update(self, point):
+        if point.available():
+            self.insert(point)
+        else:
+            self.remove(point)
+
+    # Returns a point whose circle covers the given position, or None
+    def point_at(self, pos):
+        x, y = pos
+        for point in self.cells.get(self.cell(x, y), ()):
+            if abs(point.x - x) <= point.radius and abs(point.y - y) <= point.radius:
+                return point
+        return None
@@ -0,0 +1,51 @@
+import os
+
+import pygame
+
+RESOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "res")
+BACKGROUND_IMAGE = "sproutsbg.png"
+
+_loaded = {}
+_images = {}
+
+
+### MAIN RESPONSIBILITY: SIGURD FRANK THORLUND S184189 ###
+# Process wide cache of the images in the res folder. An image is read from disk and decoded the first time it is
+# asked for, and the converted and scaled versions are kept as well. The surfaces are shared, so they must not be
+# drawn on
+
+# Returns the image as it is stored on disk. Can be used before the display is created, e.g. for the window icon
+def load(name):
+    surface = _loaded.get(name)
+    if surface is None:
+        surface = pygame.image.load(os.path.join(RESOURCE_DIR, name))
+        _loaded[name] = surface
+    return surface
+
+
+# Returns the image converted to the pixel format of the display, so blitting it is fast
+# Input: The file name of the image, and optionally a size the image is scaled to cover. Parts outside the size are
+# cut off, so the aspect ratio is kept
+# Output: The cached surface
+def image(name, size=None):
+    key = (name, size)
+    surface = _images.get(key)
+    if surface is None:
+        surface = load(name)
+        if size is not None:
+            surface = cover(surface, size)
+        if surface.get_flags() & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
+        _images[key] = surface
+    return surface
+
+
+# Scales the surface to the smallest size covering the given size, and crops it to that size
+def cover(surface, size):
+    width, height = surface.get_size()
+    scale = max(size[0] / width, size[1] / height)
+    scaled = pygame.transform.smoothscale(surface, (max(size[0], round(width * scale)),
+                                                    max(size[1], round(height * scale))))
+    return scaled.subsurface(pygame.Rect((0, 0), size)).copy()
@@ -1,9 +1,12 @@
 import pygame
 
 import src.config.game_config as gc
+from src.ui.sprite_cache import font
 
 
 ### MAIN RESPONSIBILITY: SIGURD FRANK THORLUND S184189 ###
+# A label owns a surface as big as its rect. The surface is only redrawn when the text or a colour has changed, so
+# draw() can be called every frame. The surface is blitted at the position of the label
 class Label:
     def __init__(self, left, top, width, height, color, border_color, border_size, text, text_size, text_color):
         self.left = left
@@ -12,36 +15,96 @@ class Label:
         self.height = height
 
         self.rect = pygame.Rect(left, top, width, height)
-        self.center = (left + width / 2, top + height / 2)
+        self.center = (width / 2, height / 2)
 
-        self.color = color
-        self.border_color = border_color
+        self._color = color
+        self._border_color = border_color
         self.border_size = border_size
 
-        self.text = text
+        self._text = text
         self.text_size = text_size
-        self.text_color = text_color
-
-        self.surface = pygame.Surface((gc.WINDOW_WIDTH, gc.WINDOW_HEIGHT), pygame.SRCALPHA)
-
+        self._text_color = text_color
+
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.text_image = None
+        self.changed = True
+
+    ################################################
+    # Changing these invalidates the surface       #
+    ################################################
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        if text != self._text:
+            self._text = text
+            self.text_image = None
+            self.changed = True
+
+    @property
+    def text_color(self):
+        return self._text_color
+
+    @text_color.setter
+    def text_color(self, text_color):
+        if text_color != self._text_color:
+            self._text_color = text_color
+            self.text_image = None
+            self.changed = True
+
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, color):
+        if color != self._color:
+            self._color = color
+            self.changed = True
+
+    @property
+    def border_color(self):
+        return self._border_color
+
+    @border_color.setter
+    def border_color(self, border_color):
+        if border_color != self._border_color:
+            self._border_color = border_color
+            self.changed = True
+
+    # Returns the surface of the label, redrawn if anything changed since the last call
     def draw(self):
-        pygame.draw.rect(self.surface, self.color, self.rect)
-        pygame.draw.rect(self.surface, self.border_color, self.rect, self.border_size)
+        if not self.changed:
+            return self.surface
+
+        rect = self.surface.get_rect()
+        pygame.draw.rect(self.surface, self.color, rect)
+        pygame.draw.rect(self.surface, self.border_color, rect, self.border_size)
 
-        text_font = pygame.font.SysFont(None, self.text_size)
-        img = text_font.render(self.text, True, self.text_color)
-        rect = img.get_rect()
+        if self.text_image is None:
+            self.text_image = font(self.text_size).render(self.text, True, self.text_color)
+        text_rect = self.text_image.get_rect()
 
-        self.surface.blit(img, (self.center[0] - rect.width / 2, self.center[1] - rect.height / 2))
+        self.surface.blit(self.text_image, (self.center[0] - text_rect.width / 2, self.center[1] - text_rect.height / 2))
+        self.changed = False
         return self.surface
 
+    # Draws the label onto the given surface at its position
+    # Output: The area of the target that was drawn on
+    def blit(self, target):
+        return target.blit(self.draw(), self.rect)
+
     def hovering(self, mouse):
         if self.rect.collidepoint(*mouse):
             return True
         return False
 
     def clear_surface(self):
-        pygame.draw.rect(self.surface, gc.WHITE, self.rect)
+        self.surface.fill(gc.WHITE)
+        self.changed = True
 
         return self.surface
 
@@ -56,5 +119,3 @@ class Button(Label):
     # Transitions to the next state
     def get_action(self):
         return self.action, self.parameters
-
-
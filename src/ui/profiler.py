@@ -0,0 +1,121 @@
+import csv
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pygame
+
+import src.config.game_config as gc
+from src.ui.sprite_cache import font
+
+FRAME_HISTORY = 600  # Number of recent frames the percentiles are computed over
+PERCENTILES = (50, 90, 99)
+MOVE_PHASES = ("validate_path", "add_path", "update_region_tree", "game_over")
+
+OVERLAY_TEXT_SIZE = 18
+OVERLAY_LINE_HEIGHT = 16
+OVERLAY_PADDING = 4
+OVERLAY_COLOR = (255, 255, 255, 200)
+
+
+### MAIN RESPONSIBILITY: SIGURD FRANK THORLUND S184189 ###
+# Collects the time spent on each frame of the game loop, and on each phase of a move
+class Profiler:
+    def __init__(self):
+        self.frame_times = deque(maxlen=FRAME_HISTORY)
+        self.moves = []
+        self.current_move = {}
+
+    # Records the time spent on handling events and drawing a frame
+    def frame(self, seconds):
+        self.frame_times.append(seconds)
+
+    # Starts recording a new move, discarding the phases of a move that was never finished, e.g. an invalid path
+    def begin_move(self):
+        self.current_move = {}
+
+    # Adds the time spent in the with block to the given phase of the current move
+    @contextmanager
+    def measure(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    # Adds time measured elsewhere, e.g. on a worker thread, to the given phase of the current move
+    def record(self, phase, seconds):
+        self.current_move[phase] = self.current_move.get(phase, 0) + seconds
+
+    def end_move(self):
+        self.moves.append(self.current_move)
+        self.current_move = {}
+
+    # Output: The frame time percentiles in milliseconds, or None if no frames were recorded
+    def frame_percentiles(self):
+        if not self.frame_times:
+            return None
+        return dict(zip(PERCENTILES, np.percentile(np.array(self.frame_times) * 1000, PERCENTILES).tolist()))
+
+    # Output: The phase times of a move in milliseconds
+    @staticmethod
+    def move_times(move):
+        return {phase: move.get(phase, 0) * 1000 for phase in MOVE_PHASES}
+
+    # Writes the frame percentiles and the phases of every move to a csv file
+    # Input: The path of the file
+    # Output: None, the rows are (move, phase, milliseconds). Frame percentiles use "frame" as move
+    def dump_csv(self, file_path):
+        with open(file_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["move", "phase", "milliseconds"])
+
+            percentiles = self.frame_percentiles() or {}
+            for percentile, milliseconds in percentiles.items():
+                writer.writerow(["frame", "p" + str(percentile), round(milliseconds, 3)])
+
+            for number, move in enumerate(self.moves, 1):
+                for phase, milliseconds in self.move_times(move).items():
+                    writer.writerow([number, phase, round(milliseconds, 3)])
+
+
+# Draws the numbers of a profiler in a box in the corner of the game. Has the same blit interface as a Label, so it is
+# drawn together with the labels of the game
+class ProfilerOverlay:
+    def __init__(self, profiler, left=0, top=30, width=260):
+        self.profiler = profiler
+        self.visible = False
+        height = (2 + len(MOVE_PHASES)) * OVERLAY_LINE_HEIGHT + 2 * OVERLAY_PADDING
+        self.rect = pygame.Rect(left, top, width, height)
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def lines(self):
+        percentiles = self.profiler.frame_percentiles()
+        if percentiles is None:
+            lines = ["frame: no frames yet"]
+        else:
+            lines = ["frame " + "  ".join("p%d %.1f ms" % item for item in percentiles.items())]
+
+        moves = self.profiler.moves
+        if not moves:
+            return lines + ["move: no moves yet"]
+
+        lines.append("move %d" % len(moves))
+        for phase, milliseconds in self.profiler.move_times(moves[-1]).items():
+            lines.append("  %s %.1f ms" % (phase, milliseconds))
+        return lines
+
+    def draw(self):
+        text_font = font(OVERLAY_TEXT_SIZE)
+        self.surface.fill(OVERLAY_COLOR)
+        for number, line in enumerate(self.lines()):
+            image = text_font.render(line, True, gc.BLACK)
+            self.surface.blit(image, (OVERLAY_PADDING, OVERLAY_PADDING + number * OVERLAY_LINE_HEIGHT))
+        return self.surface
+
+    def blit(self, target):
+        return target.blit(self.draw(), self.rect)
@@ -0,0 +1,62 @@
+import pygame
+
+MERGE_LIMIT = 8      # Above this number of dirty rectangles, they are merged into one
+CLUSTER_WASTE = 2    # Nearby rectangles are merged when their union is at most this many times their combined area
+
+
+### MAIN RESPONSIBILITY: SIGURD FRANK THORLUND S184189 ###
+# Keeps track of the areas of the screen that changed since the last frame, and only redraws and presents those
+class Renderer:
+    def __init__(self, screen):
+        self.screen = screen
+        self.dirty = []
+
+    # Marks an area of the screen as changed
+    def mark(self, rect):
+        if rect is None:
+            return
+        rect = self.screen.get_rect().clip(rect)
+        if rect.width > 0 and rect.height > 0:
+            self.dirty.append(rect)
+
+    def mark_all(self):
+        self.dirty = [self.screen.get_rect()]
+
+    # Merges overlapping rectangles, so no area is drawn twice, and nearby rectangles, so close changes are drawn once
+    # Rectangles far apart are kept apart, unless there are more than MERGE_LIMIT of them
+    def merged_rects(self):
+        rects = []
+        for rect in self.dirty:
+            index = self.cluster_index(rect, rects)
+            while index != -1:
+                rect = rect.union(rects.pop(index))
+                index = self.cluster_index(rect, rects)
+            rects.append(rect)
+        if len(rects) > MERGE_LIMIT:
+            rects = [rects[0].unionall(rects[1:])]
+        return rects
+
+    # Returns the index of a rectangle the given rectangle overlaps or is close to, or -1
+    @staticmethod
+    def cluster_index(rect, rects):
+        for index, other in enumerate(rects):
+            if rect.colliderect(other):
+                return index
+            union = rect.union(other)
+            if union.width * union.height <= CLUSTER_WASTE * (rect.width * rect.height + other.width * other.height):
+                return index
+        return -1
+
+    # Redraws the changed areas with the given draw function and presents them
+    # Input: A function drawing the whole screen. It is called once for each merged area, clipped to it
+    # Output: None, the changed areas are updated on the display
+    def present(self, draw):
+        if not self.dirty:
+            return
+        rects = self.merged_rects()
+        for rect in rects:
+            self.screen.set_clip(rect)
+            draw()
+        self.screen.set_clip(None)
+        pygame.display.update(rects)
+        self.dirty = []
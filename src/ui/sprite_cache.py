@@ -0,0 +1,67 @@
+import pygame
+
+import src.config.game_config as gc
+
+INDEX_FONT_SIZE = 16
+
+_circles = {}
+_glyphs = {}
+_fonts = {}
+_font = None
+
+
+### MAIN RESPONSIBILITY: SIGURD FRANK THORLUND S184189 ###
+# Process wide caches of the surfaces and fonts used to draw game points and widgets. The surfaces are shared, so they
+# must not be drawn on. Game points are drawn from these caches here, so the model does not depend on the UI
+
+# Returns the default font in the given size
+def font(size):
+    text_font = _fonts.get(size)
+    if text_font is None:
+        text_font = pygame.font.SysFont(None, size)
+        _fonts[size] = text_font
+    return text_font
+
+
+# Returns the surface of a filled circle with the given radius and colour
+def circle_sprite(radius, color):
+    key = (radius, tuple(color))
+    sprite = _circles.get(key)
+    if sprite is None:
+        sprite = pygame.Surface([radius * 2, radius * 2])
+        sprite.fill(gc.WHITE)
+
+        # All white is considered to be transparent
+        sprite.set_colorkey(gc.WHITE)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        _circles[key] = sprite
+    return sprite
+
+
+# Returns the rendered text of a point index in the given colour
+def index_glyph(index, color):
+    global _font
+    key = (index, tuple(color))
+    glyph = _glyphs.get(key)
+    if glyph is None:
+        if _font is None:
+            _font = pygame.font.Font(pygame.font.get_default_font(), INDEX_FONT_SIZE)
+        glyph = _font.render(str(index), True, color)
+        _glyphs[key] = glyph
+    return glyph
+
+
+# Draws a game point with its index, if it has one
+def draw_point(point, surf):
+    surf.blit(circle_sprite(point.radius, point.color), point.rect)
+
+    if hasattr(point, 'index'):
+        surf.blit(index_glyph(point.index, gc.BLACK), point.pos())
+
+
+# Returns the area of the screen covered by a game point and its index
+def point_bounds(point) -> pygame.Rect:
+    if hasattr(point, 'index'):
+        glyph_rect = index_glyph(point.index, gc.BLACK).get_rect(topleft=(int(point.x), int(point.y)))
+        return point.rect.union(glyph_rect)
+    return point.rect.copy()
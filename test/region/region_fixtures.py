@@ -0,0 +1,38 @@
+import unittest
+
+from src.model.path import add_path
+from src.model.point import Point, GraphicsPoint
+from src.model.region import Region
+
+
+# Shared boards of the region tests
+
+
+def square(left, top, size):
+    return [Point(left, top), Point(left, top + size), Point(left + size, top + size), Point(left + size, top)]
+
+
+# Two game points a and b in one base region, on which moves are played through the region tree
+class TwoPointBoard(unittest.TestCase):
+    def setUp(self):
+        self.a = GraphicsPoint(200, 200)
+        self.b = GraphicsPoint(500, 200)
+        self.base = Region({self.a, self.b}, square(0, 0, 800), {}, set())
+
+    # Plays the move through the given clicks
+    # Output: The new game point
+    def move(self, clicks):
+        start_path, end_path, mid_point = add_path(clicks[0], clicks[-1], clicks)
+        self.base.find_region(mid_point).update_region_tree([start_path, end_path], mid_point)
+        return mid_point
+
+
+# A hand built region tree: a base region with a child, a grandchild below the child and an empty container region
+class RegionTree(unittest.TestCase):
+    def setUp(self):
+        self.base = Region({GraphicsPoint(50, 50, False)}, square(0, 0, 800), {}, set())
+        self.child = Region({GraphicsPoint(150, 150, False)}, square(100, 100, 300), {}, set(), self.base)
+        self.grandchild = Region({GraphicsPoint(210, 210, False)}, square(200, 200, 50), {}, set(), self.child)
+        self.container = Region(set(), square(500, 100, 200), {}, set(), self.base)
+        self.base.add_exclusions({self.child, self.container})
+        self.child.add_exclusions({self.grandchild})
@@ -0,0 +1,23 @@
+import unittest
+
+import numpy as np
+
+from region_fixtures import RegionTree
+from src.model.point import Point
+
+
+class TestBatchRegions(RegionTree):
+    def test_find_regions_matches_search(self):
+        points = [(x, y) for x in range(5, 800, 37) for y in range(5, 500, 29)]
+        expected = [self.base.search_region(Point(x, y)) for x, y in points]
+        self.assertEqual(expected, self.base.find_regions(np.array(points)))
+
+    def test_is_points_in_region(self):
+        points = [(x, y) for x in range(5, 800, 37) for y in range(5, 500, 29)]
+        for region in [self.base, self.child, self.grandchild]:
+            expected = [region.is_point_in_region(Point(x, y)) for x, y in points]
+            self.assertEqual(expected, region.is_points_in_region(np.array(points)).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
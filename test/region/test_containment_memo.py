@@ -0,0 +1,23 @@
+import unittest
+
+from region_fixtures import RegionTree, square
+from src.model.point import Point, GraphicsPoint
+from src.model.region import Region
+
+
+class TestContainmentMemo(RegionTree):
+    def test_memoized_result_follows_version(self):
+        point = Point(150, 350)
+        self.assertTrue(self.child.is_point_in_region(point))
+        version = self.base.version
+
+        moved = Region({GraphicsPoint(160, 340, False)}, square(140, 330, 40), {}, set(), self.child)
+        self.child.add_exclusions({moved})
+        moved.changed()
+        self.assertLess(version, self.base.version)
+        self.assertFalse(self.child.is_point_in_region(point))
+        self.assertFalse(self.base.is_point_in_region(point))
+
+
+if __name__ == '__main__':
+    unittest.main()
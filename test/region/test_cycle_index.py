@@ -0,0 +1,25 @@
+import unittest
+
+from region_fixtures import RegionTree, square
+from src.model.region import Region
+
+
+class TestCycleIndex(RegionTree):
+    # The cycle index is updated with the exclusions, not rebuilt when the version changes
+    def test_cycle_index(self):
+        cycle = [object(), object(), object()]
+        region = Region(set(), square(600, 300, 50), {}, set(), self.base, cycle=cycle)
+        cycles = self.base.cycle_index()
+        self.assertNotIn(frozenset(cycle), cycles)
+
+        self.base.add_exclusions({region})
+        region.changed()
+        self.assertIs(cycles, self.base.cycle_index())
+        self.assertIs(region, cycles[frozenset(reversed(cycle))])
+
+        self.base.remove_exclusions({region})
+        self.assertNotIn(frozenset(cycle), self.base.cycle_index())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from region_fixtures import TwoPointBoard
+from src.model.move_stats import MoveStats
+from src.model.point import Point
+
+
+class TestMoveStats(TwoPointBoard):
+    def test_off_by_default(self):
+        stats = MoveStats()
+        self.move([self.a, Point(350, 300), self.b])
+        self.assertEqual([], stats.moves)
+
+    def test_record_per_move(self):
+        with MoveStats() as stats:
+            self.move([self.a, Point(350, 300), self.b])
+            # A loop from a back to itself closes a cycle around b
+            self.move([self.a, Point(400, 50), Point(700, 250), Point(400, 450), self.a])
+        self.move([self.b, Point(450, 150), Point(450, 250), self.b])
+
+        self.assertEqual(2, len(stats.moves))
+        first, second = stats.moves
+        self.assertEqual(0, first["counters"]["cycles"])
+        self.assertEqual(0, first["tree_depth"])
+        self.assertNotIn("insert_rotation", first["phases"])
+
+        self.assertEqual(1, second["counters"]["cycles"])
+        self.assertEqual(1, second["tree_depth"])
+        for phase in ["detect_cycles", "create_regions", "insert_rotation", "transfer_points", "update_connections"]:
+            self.assertIn(phase, second["phases"])
+        self.assertGreater(second["counters"]["pip_calls"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+from region_fixtures import RegionTree
+from src.model.point import GraphicsPoint
+from src.model.region import Region
+
+
+class TestOpenRegions(RegionTree):
+    def test_open_regions(self):
+        self.assertEqual({self.base, self.child, self.grandchild}, self.base.index.open_regions)
+        self.assertIsNotNone(self.base.find_open_region())
+
+        for region in [self.base, self.child, self.grandchild]:
+            point = next(iter(region.game_points))
+            point.num_paths = 2
+            Region.update_all_connections({point}, {region})
+        self.assertEqual(set(), self.base.index.open_regions)
+        self.assertIsNone(self.base.find_open_region())
+
+    # A point added to a closed board, as the Enter key does, opens its region again
+    def test_added_point_opens_region(self):
+        for region in [self.base, self.child, self.grandchild]:
+            point = next(iter(region.game_points))
+            point.num_paths = 2
+            Region.update_all_connections({point}, {region})
+        self.assertIsNone(self.base.find_open_region())
+
+        self.base.add_point(GraphicsPoint(60, 60, False))
+        self.assertIs(self.base, self.base.find_open_region())
+        self.assertEqual(self.base.compute_connections(), self.base.open_connections)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+
+from src.model.cubic_bezier import Bezier
+from src.model.path import Path
+from src.model.point import Point, GraphicsPoint
+from src.model.point_in_polygon import BezierBorder, EdgeTable, PointInPolygon, SimplifiedBorder, simplify
+
+
+class TestPointInPolygon(unittest.TestCase):
+    def setUp(self):
+        # A U shape, so a ray to the right of a point can cross the border several times
+        self.border = PointInPolygon.border_array([Point(100, 100), Point(100, 300), Point(300, 300), Point(300, 100),
+                                                   Point(250, 100), Point(250, 250), Point(150, 250), Point(150, 100)])
+
+    def test_contains(self):
+        self.assertTrue(PointInPolygon.contains(self.border, Point(125, 200)))
+        self.assertTrue(PointInPolygon.contains(self.border, Point(200, 275)))
+        self.assertFalse(PointInPolygon.contains(self.border, Point(200, 200)))
+        self.assertFalse(PointInPolygon.contains(self.border, Point(50, 200)))
+
+    def test_ray_through_corner(self):
+        # The rays of these points pass through corners of the border
+        self.assertTrue(PointInPolygon.contains(self.border, Point(125, 250)))
+        self.assertFalse(PointInPolygon.contains(self.border, Point(50, 300)))
+
+    def test_on_border(self):
+        self.assertTrue(PointInPolygon.contains(self.border, Point(100, 200)))
+        self.assertTrue(PointInPolygon.contains(self.border, Point(200, 250)))
+        self.assertTrue(PointInPolygon.contains(self.border, Point(300, 300)))
+
+    def test_winding_direction(self):
+        winding, _ = PointInPolygon.winding_numbers(self.border, [(125, 200)])
+        reversed_winding, _ = PointInPolygon.winding_numbers(self.border[::-1], [(125, 200)])
+        self.assertEqual(1, abs(winding[0]))
+        self.assertEqual(-winding[0], reversed_winding[0])
+
+    def test_contains_all_matches_contains(self):
+        points = np.random.RandomState(0).uniform(50, 350, (500, 2))
+        expected = [PointInPolygon.contains(self.border, Point(*point)) for point in points.tolist()]
+        self.assertEqual(expected, PointInPolygon.contains_all(self.border, points).tolist())
+
+    def test_edge_table(self):
+        edges = EdgeTable(self.border)
+        self.assertEqual(8, len(edges))
+        self.assertEqual([False, True, False, True, False, True, False, True], edges.skip.tolist())
+        self.assertEqual([0, 2, 4, 5, 6], edges.near(250))
+        self.assertTrue(PointInPolygon.contains(edges, Point(125, 200)))
+
+    def test_simplify(self):
+        # Extra corners halfway along the edges of the U, moved off the edge by less than the tolerance
+        border = []
+        for start, end in zip(self.border, np.roll(self.border, -1, axis=0)):
+            border.extend([start, (start + end) / 2 + 1])
+        kept, deviation = simplify(np.array(border), 2)
+        # The corners of the U are kept, the first corner may split the line through an extra corner
+        self.assertTrue(set(range(0, 16, 2)).issubset(kept.tolist()))
+        self.assertLessEqual(len(kept), 9)
+        self.assertAlmostEqual(1, deviation)
+
+    def test_simplified_border_matches_exact(self):
+        angles = np.linspace(0, 2 * np.pi, 500, endpoint=False)
+        radii = 100 + 20 * np.sin(5 * angles) + np.random.RandomState(0).uniform(-1, 1, angles.size)
+        border = np.c_[200 + radii * np.cos(angles), 200 + radii * np.sin(angles)]
+        simplified = SimplifiedBorder(border)
+        self.assertLess(len(simplified), len(border) // 4)
+
+        points = np.vstack([np.random.RandomState(1).uniform(50, 350, (500, 2)), border, border + 0.5])
+        expected = PointInPolygon.contains_all(border, points).tolist()
+        self.assertEqual(expected, PointInPolygon.contains_all(simplified, points).tolist())
+        self.assertEqual(expected, [PointInPolygon.contains(simplified, Point(*point)) for point in points.tolist()])
+
+    def bezier_cycle(self):
+        # A lens from a to b, curving up on the way there and down on the way back. The second path is stored from a
+        # to b as well, so it is traversed backwards
+        a = GraphicsPoint(100, 200, False)
+        b = GraphicsPoint(300, 200, False)
+        upper = Path([Bezier(a, b, Point(150, 50), Point(250, 50))], a, b)
+        lower = Path([Bezier(a, b, Point(150, 350), Point(250, 350))], a, b)
+        return [upper, lower]
+
+    def test_bezier_border(self):
+        cycle = self.bezier_cycle()
+        border = BezierBorder(cycle)
+        self.assertEqual(2, len(border))
+        self.assertTrue(border.contains(Point(200, 200)))
+        self.assertTrue(border.contains(Point(200, 100)))
+        self.assertFalse(border.contains(Point(200, 50)))
+        self.assertFalse(border.contains(Point(90, 200)))
+
+        # Points on the curves, including their end points
+        self.assertTrue(border.contains(Point(100, 200)))
+        on_curve = cycle[0].beziers[0].evaluate(0.3)
+        self.assertTrue(border.contains(Point(on_curve.x, on_curve.y)))
+
+    def test_bezier_border_matches_approximation(self):
+        cycle = self.bezier_cycle()
+        approximation = PointInPolygon.border_array(cycle[0].beziers[0].approximate_bezier(0.01) +
+                                                    cycle[1].beziers[0].approximate_bezier(0.01)[::-1][1:-1])
+        points = np.random.RandomState(2).uniform(50, 350, (500, 2))
+        expected = PointInPolygon.contains_all(approximation, points).tolist()
+        self.assertEqual(expected, PointInPolygon.contains_all(BezierBorder(cycle), points).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
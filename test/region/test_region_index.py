@@ -0,0 +1,59 @@
+import contextlib
+import io
+import random
+import unittest
+
+from region_fixtures import RegionTree, square
+from src.benchmark.region_benchmark import BenchmarkGame
+from src.model.bounding_box import get_bounding_box
+from src.model.move_stats import MoveStats
+from src.model.point import Point, GraphicsPoint
+from src.model.region import Region
+
+
+class TestRegionIndex(RegionTree):
+    def test_find_region(self):
+        self.assertIs(self.base, self.base.find_region(Point(50, 450)))
+        self.assertIs(self.child, self.base.find_region(Point(150, 350)))
+        self.assertIs(self.grandchild, self.base.find_region(Point(225, 225)))
+
+    def test_container_skipped(self):
+        self.assertIs(self.base, self.base.find_region(Point(600, 200)))
+
+    def test_matches_search(self):
+        for x in range(5, 800, 37):
+            for y in range(5, 500, 29):
+                point = Point(x, y)
+                self.assertIs(self.base.search_region(point), self.base.find_region(point))
+
+    def test_bounding_box(self):
+        min_point, max_point = get_bounding_box([Point(300, 300), Point(200, 100), Point(100, 200)])
+        self.assertEqual((Point(100, 100), Point(300, 300)), (min_point, max_point))
+
+    # The index finds the same region as the descent of the tree in played games
+    def test_matches_search_in_games(self):
+        for seed in range(3):
+            game = BenchmarkGame(8, seed)
+            with MoveStats() as stats, contextlib.redirect_stdout(io.StringIO()):
+                game.play(stats)
+            generator = random.Random(seed)
+            for _ in range(500):
+                point = Point(generator.uniform(0, game.width), generator.uniform(0, game.height))
+                self.assertIs(game.base_region.search_region(point), game.base_region.find_region(point))
+
+    def test_moved_region(self):
+        self.assertIs(self.base, self.base.find_region(Point(550, 150)))
+        moved = Region({GraphicsPoint(560, 160, False)}, square(540, 140, 50), {}, set(), self.base)
+        self.base.add_exclusions({moved})
+        self.assertIs(moved, self.base.find_region(Point(550, 150)))
+
+        # Moving the region below the container makes it deeper than before
+        self.base.remove_exclusions({moved})
+        self.container.add_exclusions({moved})
+        moved.parent = self.container
+        self.base.index.tree_changed()
+        self.assertIs(moved, self.base.find_region(Point(550, 150)))
+
+
+if __name__ == '__main__':
+    unittest.main()
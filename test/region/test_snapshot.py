@@ -0,0 +1,73 @@
+import unittest
+
+from region_fixtures import TwoPointBoard
+from src.model.point import Point, GraphicsPoint
+from src.model.snapshot import Snapshot
+
+
+class TestSnapshot(TwoPointBoard):
+
+    def state(self):
+        regions = sorted(self.base.subtree(), key=lambda region: region.id)
+        return [(region.id, set(region.game_points), {point: set(paths) for point, paths in region.edge_map.items()},
+                 set(region.exclusions), region.parent, region.open_connections, dict(region.subtree_points))
+                for region in regions], \
+               [(point.num_paths, list(point.paths), set(point.regions)) for point in [self.a, self.b]], \
+               set(self.base.index.open_regions)
+
+    # A loop from a back to itself, which splits the base region in two
+    def loop(self):
+        return self.move([self.a, Point(150, 100), Point(100, 250), self.a])
+
+    def test_restore(self):
+        before = self.state()
+        snapshot = Snapshot.take()
+        self.loop()
+        self.assertNotEqual(before, self.state())
+        self.assertGreater(len(snapshot), 0)
+
+        snapshot.restore()
+        self.assertEqual(before, self.state())
+        self.assertIs(self.base, self.base.find_region(Point(150, 150)))
+
+    def test_branch(self):
+        snapshot = Snapshot.take()
+        self.loop()
+        after = self.state()
+        snapshot.restore()
+
+        # The same move played again from the restored state gives the same regions
+        self.loop()
+        self.assertEqual(len(after[0]), len(self.state()[0]))
+        self.assertEqual(after[1][0][0], self.a.num_paths)
+
+    def test_release_into_outer(self):
+        before = self.state()
+        outer = Snapshot.take()
+        inner = Snapshot.take()
+        self.loop()
+        with self.assertRaises(Exception):
+            outer.restore()
+        inner.release()
+        outer.restore()
+        self.assertEqual(before, self.state())
+
+    def test_restore_gives_back_points(self):
+        last = GraphicsPoint(0, 0)
+        snapshot = Snapshot.take()
+        self.loop()
+        snapshot.restore()
+        self.assertEqual(last.index + 1, GraphicsPoint(0, 0).index)
+
+    # A move in a region with many points only copies the entries it changes
+    def test_copies_changed_entries(self):
+        for i in range(100):
+            self.base.add_point(GraphicsPoint(20 + 7 * i, 600))
+        snapshot = Snapshot.take()
+        self.loop()
+        self.assertLess(len(snapshot), 50)
+        snapshot.restore()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from region_fixtures import RegionTree
+from src.model.point import GraphicsPoint
+
+
+class TestSubtreePoints(RegionTree):
+    # The points of a subtree are counted as they change, a point in two regions of the subtree is counted twice
+    def test_points_in_subtree(self):
+        self.assertEqual(3, len(self.base.points_in_subtree()))
+
+        point = GraphicsPoint(220, 220, False)
+        self.grandchild.add_point(point)
+        self.child.add_point(point)
+        self.assertIn(point, self.base.points_in_subtree())
+        self.assertEqual(2, self.base.subtree_points[point])
+
+        self.grandchild.remove_point(point)
+        self.assertIn(point, self.base.points_in_subtree())
+        self.child.remove_point(point)
+        self.assertNotIn(point, self.base.points_in_subtree())
+
+        self.base.remove_exclusions({self.child})
+        self.assertEqual(set(self.base.game_points), set(self.base.points_in_subtree()))
+
+
+if __name__ == '__main__':
+    unittest.main()
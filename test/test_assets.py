@@ -0,0 +1,33 @@
+import unittest
+
+import pygame
+
+import src.config.game_config as gc
+from src.ui import assets
+
+
+class TestAssets(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((gc.WINDOW_WIDTH, gc.WINDOW_HEIGHT))
+
+    def test_loaded_once(self):
+        self.assertIs(assets.load(assets.BACKGROUND_IMAGE), assets.load(assets.BACKGROUND_IMAGE))
+
+    def test_scaled_to_window(self):
+        size = (gc.WINDOW_WIDTH, gc.WINDOW_HEIGHT)
+        background = assets.image(assets.BACKGROUND_IMAGE, size)
+        self.assertEqual(size, background.get_size())
+        self.assertIs(background, assets.image(assets.BACKGROUND_IMAGE, size))
+
+    def test_cover_keeps_aspect_ratio(self):
+        surface = pygame.Surface((100, 50))
+        surface.fill(gc.BLACK)
+        pygame.draw.rect(surface, gc.WHITE, pygame.Rect(0, 0, 50, 50))
+        covered = assets.cover(surface, (100, 100))
+        self.assertEqual((100, 100), covered.get_size())
+        self.assertEqual(gc.WHITE, tuple(covered.get_at((90, 50)))[:3])
+
+
+if __name__ == '__main__':
+    unittest.main()
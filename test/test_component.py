@@ -0,0 +1,51 @@
+import unittest
+
+import pygame
+
+import src.config.game_config as gc
+from src.ui.component import Label
+from src.ui.sprite_cache import font
+
+
+class TestLabel(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def create_label(self):
+        return Label(50, 100, 200, 30, gc.WHITE, gc.BLACK, 2, "text", 22, gc.UI_BUTTON_TEXT_COLOR)
+
+    def test_surface_size_of_rect(self):
+        label = self.create_label()
+        self.assertEqual((200, 30), label.draw().get_size())
+
+    def test_blit_at_position(self):
+        label = self.create_label()
+        screen = pygame.Surface((gc.WINDOW_WIDTH, gc.WINDOW_HEIGHT))
+        self.assertEqual(label.rect, label.blit(screen))
+        self.assertEqual(gc.BLACK, tuple(screen.get_at((50, 100)))[:3])
+
+    def test_text_cached_until_changed(self):
+        label = self.create_label()
+        label.draw()
+        text_image = label.text_image
+
+        label.text = "text"
+        label.draw()
+        self.assertIs(text_image, label.text_image)
+
+        label.color = gc.UI_BUTTON_COLOR
+        label.draw()
+        self.assertIs(text_image, label.text_image)
+        self.assertEqual(gc.UI_BUTTON_COLOR, tuple(label.surface.get_at((100, 5)))[:3])
+
+        label.text = "other"
+        label.draw()
+        self.assertIsNot(text_image, label.text_image)
+
+    def test_fonts_shared(self):
+        self.assertIs(font(22), font(22))
+        self.assertIsNot(font(22), font(25))
+
+
+if __name__ == '__main__':
+    unittest.main()
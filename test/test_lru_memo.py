@@ -0,0 +1,26 @@
+import unittest
+
+from src.model.lru_memo import LRUMemo
+
+
+class TestLRUMemo(unittest.TestCase):
+    def test_get_put(self):
+        memo = LRUMemo()
+        self.assertIs(LRUMemo.MISSING, memo.get("a"))
+        memo.put("a", False)
+        self.assertFalse(memo.get("a"))
+        self.assertEqual((1, 1), (memo.hits, memo.misses))
+
+    def test_least_recently_used_dropped(self):
+        memo = LRUMemo(max_size=2)
+        memo.put("a", 1)
+        memo.put("b", 2)
+        memo.get("a")
+        memo.put("c", 3)
+        self.assertEqual(2, len(memo))
+        self.assertIs(LRUMemo.MISSING, memo.get("b"))
+        self.assertEqual(1, memo.get("a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
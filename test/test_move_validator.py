@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+import unittest
+
+import pygame
+
+import src.config.game_config as gc
+from src.main.main import Main
+from src.main.move_validator import MoveValidator, VALIDATION_DONE, THREAD_NAME
+from src.model.point import GraphicsPoint
+from src.ui.renderer import Renderer
+
+
+# Returns the number of running worker threads of move validators
+def validator_threads():
+    return sum(1 for thread in threading.enumerate() if thread.name.startswith(THREAD_NAME))
+
+
+class TestMoveValidator(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.event.clear()
+        self.release = threading.Event()
+
+    def validate(self, path, paths, point_snapshot):
+        self.release.wait()
+        return [], path not in paths
+
+    def test_result_when_done(self):
+        validator = MoveValidator(self.validate)
+        validator.submit("path", ["points"], ["other path"], None)
+        self.assertTrue(validator.busy())
+        self.assertIsNone(validator.result())
+
+        self.release.set()
+        validator.executor.shutdown(wait=True)
+        path, path_points, intersections, valid_path, seconds = validator.result()
+        self.assertEqual(("path", ["points"], [], True), (path, path_points, intersections, valid_path))
+        self.assertFalse(validator.busy())
+        self.assertEqual(1, len(pygame.event.get(VALIDATION_DONE)))
+
+    def test_canceled_result_ignored(self):
+        validator = MoveValidator(self.validate)
+        validator.submit("path", ["points"], [], None)
+        validator.cancel()
+        self.release.set()
+        validator.executor.shutdown(wait=True)
+        self.assertIsNone(validator.result())
+
+    # A game started after game over reuses the state of the last one, its worker thread must be stopped
+    def test_restarted_game_stops_worker(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        main = Main.__new__(Main)
+        main.SCREEN = pygame.display.set_mode((gc.WINDOW_WIDTH, gc.WINDOW_HEIGHT))
+        main.renderer = Renderer(main.SCREEN)
+        main.border_points = [GraphicsPoint(0, 0, False), GraphicsPoint(gc.WINDOW_WIDTH, 0, False),
+                              GraphicsPoint(gc.WINDOW_WIDTH, gc.WINDOW_HEIGHT, False),
+                              GraphicsPoint(0, gc.WINDOW_HEIGHT, False)]
+        main.validator = None
+        self.release.set()
+        before = validator_threads()
+
+        # The old validators are kept, so their threads are not stopped by garbage collection
+        validators = []
+        for _ in range(3):
+            main.paths = []
+            main.set_initial_state([GraphicsPoint(100, 100), GraphicsPoint(300, 300)], [])
+            # The worker thread is started by the first job
+            main.validator.executor.submit(time.sleep, 0).result()
+            validators.append(main.validator)
+
+        deadline = time.time() + 5
+        while validator_threads() > before + 1 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(before + 1, validator_threads())
+        main.validator.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
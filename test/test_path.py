@@ -0,0 +1,38 @@
+import unittest
+
+from src.model.path import Path, COARSE_TOLERANCE
+from src.model.point import Point, GraphicsPoint
+
+
+class TestPathApproximation(unittest.TestCase):
+    def create_path(self):
+        anchor_points = [GraphicsPoint(100, 100, False), Point(250, 400), Point(400, 150), GraphicsPoint(600, 300, False)]
+        return Path.from_points(anchor_points)
+
+    def test_approximation_end_points(self):
+        path = self.create_path()
+        approximation = path.approximate()
+        self.assertIs(path.start_point, approximation[0])
+        self.assertIs(path.end_point, approximation[-1])
+
+    def test_coarse_approximation_is_smaller(self):
+        path = self.create_path()
+        fine = path.approximation_array()
+        coarse = path.approximation_array(COARSE_TOLERANCE)
+        self.assertEqual(2, coarse.shape[1])
+        self.assertLess(len(coarse), len(fine))
+
+    def test_approximation_is_cached(self):
+        path = self.create_path()
+        self.assertIs(path.approximation_array(), path.approximation_array())
+
+    def test_point_touches_path(self):
+        path = self.create_path()
+        on_path = GraphicsPoint(*path.beziers[1].evaluate(0.5).pos(), False)
+        far_away = GraphicsPoint(700, 50, False)
+        self.assertTrue(path.point_touches_path(on_path))
+        self.assertFalse(path.point_touches_path(far_away))
+
+
+if __name__ == '__main__':
+    unittest.main()
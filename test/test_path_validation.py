@@ -0,0 +1,42 @@
+import contextlib
+import io
+import unittest
+
+from src.model.path import Path
+from src.model.path_validation import validate_path
+from src.model.point import Point, GraphicsPoint
+from src.model.point_snapshot import PointSnapshot
+
+
+class TestPathValidation(unittest.TestCase):
+    def setUp(self):
+        self.points = [GraphicsPoint(100, 200), GraphicsPoint(500, 200), GraphicsPoint(300, 400)]
+        self.paths = [Path.from_points([Point(300, 100), Point(310, 200), Point(300, 300)])]
+
+    def validate(self, clicks):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return validate_path(Path.from_points(clicks), self.paths, PointSnapshot(self.points))
+
+    def test_valid_path(self):
+        intersections, valid = self.validate([self.points[0], Point(300, 350), self.points[1]])
+        self.assertTrue(valid)
+        self.assertEqual([], intersections)
+
+    def test_crosses_path(self):
+        intersections, valid = self.validate([self.points[0], Point(300, 180), self.points[1]])
+        self.assertFalse(valid)
+        self.assertTrue(intersections)
+
+    def test_touches_point(self):
+        _, valid = self.validate([self.points[0], Point(300, 400), self.points[1]])
+        self.assertFalse(valid)
+
+    def test_too_many_connections(self):
+        self.points[0].add_to_path(None)
+        self.points[0].add_to_path(None)
+        _, valid = self.validate([self.points[0], Point(50, 150), Point(50, 250), self.points[0]])
+        self.assertFalse(valid)
+
+
+if __name__ == '__main__':
+    unittest.main()
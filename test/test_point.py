@@ -0,0 +1,44 @@
+import unittest
+
+import pygame
+
+import src.config.game_config as gc
+from src.model.point import Point, GraphicsPoint
+
+
+class TestPoint(unittest.TestCase):
+    def test_value_equality(self):
+        self.assertEqual(Point(1, 2), Point(1, 2))
+        self.assertEqual(1, len({Point(1, 2), Point(1, 2)}))
+
+    def test_graphics_point_identity(self):
+        p = GraphicsPoint(1, 2, False)
+        q = GraphicsPoint(1, 2, False)
+        self.assertNotEqual(p, q)
+        self.assertNotEqual(p, Point(1, 2))
+        self.assertTrue(p.equals(q))
+        self.assertEqual(2, len({p, q}))
+
+    def test_in_place_arithmetic(self):
+        p = Point(1, 2)
+        q = p
+        p += Point(2, 3)
+        p.scalar_ip(2)
+        self.assertIs(p, q)
+        self.assertEqual((6, 10), p.pos())
+
+    def test_tuple_arithmetic(self):
+        p = Point(4, 6)
+        self.assertEqual((5, 8), p.add_pos(Point(1, 2)))
+        self.assertEqual((3, 4), p.sub_pos(Point(1, 2)))
+        self.assertEqual((2, 3), p.scalar_pos(0.5))
+
+    def test_draw(self):
+        pygame.init()
+        surf = pygame.Surface((40, 40))
+        GraphicsPoint(20, 20, False).draw(surf)
+        self.assertEqual(gc.POINT_COLOR[:3], tuple(surf.get_at((20, 20)))[:3])
+
+
+if __name__ == '__main__':
+    unittest.main()
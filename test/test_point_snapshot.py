@@ -0,0 +1,34 @@
+import unittest
+
+from src.model.point import GraphicsPoint
+from src.model.point_snapshot import PointSnapshot
+
+
+class TestPointSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.points = [GraphicsPoint(100, 100), GraphicsPoint(200, 100), GraphicsPoint(300, 100)]
+
+    def test_copies_points(self):
+        self.points[0].add_to_path(None)
+        self.points[0].update_radius(4)
+        snapshot = PointSnapshot(self.points)
+        self.assertEqual(3, len(snapshot))
+        self.assertEqual(1, snapshot.degree(self.points[0]))
+        self.assertEqual([100, 100], snapshot.positions[0].tolist())
+        self.assertEqual(4, snapshot.radii[0])
+
+    def test_circles_in_box(self):
+        positions, radii = PointSnapshot(self.points).circles_in_box(195, 50, 400, 150)
+        self.assertEqual([[200, 100], [300, 100]], positions.tolist())
+        self.assertEqual([9, 9], radii.tolist())
+
+    def test_unchanged_by_game(self):
+        snapshot = PointSnapshot(self.points)
+        self.points[0].add_to_path(None)
+        self.points.append(GraphicsPoint(150, 100))
+        self.assertEqual(0, snapshot.degree(self.points[0]))
+        self.assertEqual([[100, 100], [200, 100]], snapshot.circles_in_box(50, 50, 250, 150)[0].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import csv
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.ui.profiler import Profiler, ProfilerOverlay, MOVE_PHASES
+
+
+class TestProfiler(unittest.TestCase):
+    def create_profiler(self):
+        profiler = Profiler()
+        for milliseconds in range(1, 101):
+            profiler.frame(milliseconds / 1000)
+
+        profiler.begin_move()
+        with profiler.measure("validate_path"):
+            pass
+        profiler.end_move()
+        return profiler
+
+    def test_frame_percentiles(self):
+        percentiles = self.create_profiler().frame_percentiles()
+        self.assertAlmostEqual(50.5, percentiles[50])
+        self.assertAlmostEqual(99.01, percentiles[99])
+
+    def test_unfinished_move_discarded(self):
+        profiler = self.create_profiler()
+        profiler.begin_move()
+        with profiler.measure("validate_path"):
+            pass
+        profiler.begin_move()
+        self.assertEqual({}, profiler.current_move)
+        self.assertEqual(1, len(profiler.moves))
+
+    def test_dump_csv(self):
+        profiler = self.create_profiler()
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "profile.csv")
+            profiler.dump_csv(file_path)
+            with open(file_path, newline="") as file:
+                rows = list(csv.reader(file))
+        self.assertEqual(["move", "phase", "milliseconds"], rows[0])
+        self.assertEqual(["frame", "p50", "50.5"], rows[1])
+        self.assertEqual([str(1)] * len(MOVE_PHASES), [row[0] for row in rows[4:]])
+
+    def test_overlay_draws(self):
+        pygame.init()
+        overlay = ProfilerOverlay(self.create_profiler())
+        self.assertEqual(overlay.rect.size, overlay.draw().get_size())
+        self.assertIn("move 1", overlay.lines())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import json
+import unittest
+
+from src.benchmark.region_benchmark import PHASES, run
+
+
+class TestRegionBenchmark(unittest.TestCase):
+    def test_run(self):
+        report = run(sizes=(2, 4), games=1, max_moves=3)
+        self.assertEqual([2, 4], report["sizes"])
+        for phase in PHASES:
+            self.assertEqual(2, len(report["curves"][phase]))
+
+        result = report["results"]["4"]
+        self.assertEqual(sum(result["moves_per_game"]), len(result["moves"]))
+        self.assertLessEqual(result["moves_per_game"][0], 3)
+        json.dumps(report)
+
+    def test_seeded(self):
+        first = run(sizes=(3,), games=1, max_moves=4)
+        second = run(sizes=(3,), games=1, max_moves=4)
+        self.assertEqual(first["results"]["3"]["moves_per_game"], second["results"]["3"]["moves_per_game"])
+        self.assertEqual([move["regions"] for move in first["results"]["3"]["moves"]],
+                         [move["regions"] for move in second["results"]["3"]["moves"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
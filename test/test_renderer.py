@@ -0,0 +1,48 @@
+import os
+import unittest
+
+import pygame
+
+from src.ui.renderer import Renderer
+
+
+class TestRenderer(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        self.screen = pygame.display.set_mode((200, 100))
+        self.renderer = Renderer(self.screen)
+
+    def test_merged_rects(self):
+        self.renderer.mark(pygame.Rect(0, 0, 20, 20))
+        self.renderer.mark(pygame.Rect(10, 10, 20, 20))
+        self.renderer.mark(pygame.Rect(100, 50, 10, 10))
+        self.renderer.mark(pygame.Rect(190, 90, 50, 50))
+        self.assertEqual([pygame.Rect(0, 0, 30, 30), pygame.Rect(100, 50, 10, 10), pygame.Rect(190, 90, 10, 10)],
+                         self.renderer.merged_rects())
+
+    def test_nearby_rects_merged(self):
+        self.renderer.mark(pygame.Rect(0, 0, 20, 20))
+        self.renderer.mark(pygame.Rect(25, 0, 20, 20))
+        self.assertEqual([pygame.Rect(0, 0, 45, 20)], self.renderer.merged_rects())
+
+    def test_merged_above_limit(self):
+        for x in range(0, 200, 20):
+            self.renderer.mark(pygame.Rect(x, 0, 5, 5))
+        self.assertEqual([pygame.Rect(0, 0, 185, 5)], self.renderer.merged_rects())
+
+    # Changes far apart are drawn apart, instead of drawing the area between them
+    def test_present_draws_per_area(self):
+        clips = []
+        self.renderer.mark(pygame.Rect(0, 0, 20, 20))
+        self.renderer.mark(pygame.Rect(180, 80, 20, 20))
+        self.renderer.present(lambda: clips.append(self.screen.get_clip()))
+        self.assertEqual([pygame.Rect(0, 0, 20, 20), pygame.Rect(180, 80, 20, 20)], clips)
+        self.assertEqual([], self.renderer.dirty)
+
+        # Nothing changed, nothing is drawn
+        self.renderer.present(lambda: clips.append(self.screen.get_clip()))
+        self.assertEqual(2, len(clips))
+
+if __name__ == '__main__':
+    unittest.main()
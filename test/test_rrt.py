@@ -0,0 +1,25 @@
+import unittest
+
+import pygame
+
+import src.config.game_config as gc
+from src.model.point import Point, GraphicsPoint
+from src.model.region import Region
+from src.model.rrt import RRT, Node
+
+
+class TestRRT(unittest.TestCase):
+    def setUp(self):
+        self.a = GraphicsPoint(200, 200)
+        self.b = GraphicsPoint(500, 200)
+        border = [Point(0, 0), Point(0, 400), Point(700, 400), Point(700, 0)]
+        self.base = Region({self.a, self.b}, border, {}, set())
+        self.rrt = RRT(self.a, [], pygame.Surface((gc.WINDOW_WIDTH, gc.WINDOW_HEIGHT)), [self.a, self.b])
+
+    def test_free_conf_mask(self):
+        nodes = [Node(Point(100, 100)), Node(Point(-10, 100)), Node(Point(750, 100)), Node(Point(300, 300))]
+        self.assertEqual([True, False, False, True], self.rrt.free_conf_mask(nodes, {self.base}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from src.model.point import GraphicsPoint
+from src.model.spatial_hash import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    def create_hash(self):
+        spatial_hash = SpatialHash()
+        points = [GraphicsPoint(100, 100, False), GraphicsPoint(130, 100, False), GraphicsPoint(64, 64, False)]
+        for point in points:
+            spatial_hash.insert(point)
+        return spatial_hash, points
+
+    def test_point_at(self):
+        spatial_hash, points = self.create_hash()
+        self.assertIs(points[0], spatial_hash.point_at((104, 96)))
+        self.assertIs(points[1], spatial_hash.point_at((122, 100)))
+        self.assertIsNone(spatial_hash.point_at((115, 100)))
+
+    def test_point_across_cells(self):
+        spatial_hash, points = self.create_hash()
+        for pos in [(58, 58), (70, 58), (58, 70), (70, 70)]:
+            self.assertIs(points[2], spatial_hash.point_at(pos))
+
+    def test_unavailable_removed(self):
+        spatial_hash, points = self.create_hash()
+        points[0].paths = [None, None, None]
+        spatial_hash.update(points[0])
+        self.assertIsNone(spatial_hash.point_at((100, 100)))
+        self.assertNotIn(points[0], spatial_hash)
+        self.assertEqual(2, len(spatial_hash))
+
+
+if __name__ == '__main__':
+    unittest.main()